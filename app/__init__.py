@@ -4,5 +4,5 @@ Runtime modules:
   main             pywebview entry point
   bridge           Python <-> JS API + DownloadManager
   legacy_gui       Tkinter fallback UI
-  legacy_backend   async yt-dlp wrapper (used only by legacy_gui)
+  legacy_backend   standalone async yt-dlp wrapper (run as a script)
 """
@@ -448,9 +448,11 @@ def _load_json(path: Path, default: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def _save_json(path: Path, data: Dict[str, Any]) -> None:
+    # json.dump() with indent hands the file one write() per token; encode
+    # up front so the whole document goes out in a single write.
     tmp = path.with_suffix(path.suffix + ".tmp")
     with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+        f.write(json.dumps(data, indent=2))
     os.replace(tmp, path)
 
 
@@ -900,7 +902,7 @@ class DownloadManager:
                 snapshot = [dict(i) for i in self._items]
             tmp = QUEUE_FILE.with_suffix(QUEUE_FILE.suffix + ".tmp")
             with open(tmp, "w", encoding="utf-8") as f:
-                json.dump(snapshot, f, indent=2)
+                f.write(json.dumps(snapshot, indent=2))
             os.replace(tmp, QUEUE_FILE)
         except OSError:
             traceback.print_exc()
@@ -1692,7 +1694,7 @@ class PyBridge:
         try:
             tmp = HISTORY_FILE.with_suffix(HISTORY_FILE.suffix + ".tmp")
             with open(tmp, "w", encoding="utf-8") as f:
-                json.dump(self._history, f, indent=2)
+                f.write(json.dumps(self._history, indent=2))
             os.replace(tmp, HISTORY_FILE)
         except OSError:
             traceback.print_exc()
@@ -2358,13 +2360,14 @@ class PyBridge:
             if not path:
                 return None
             target = path if isinstance(path, str) else path[0]
+            lines = ["date,time,title,status,size,quality,url"]
+            for h in self._history:
+                row = [h.get("date", ""), h.get("time", ""), h.get("title", ""),
+                       h.get("status", ""), h.get("size", ""), h.get("quality", ""),
+                       h.get("url", "")]
+                lines.append(",".join(f'"{c.replace(chr(34), chr(34)*2)}"' for c in row))
             with open(target, "w", encoding="utf-8", newline="") as f:
-                f.write("date,time,title,status,size,quality,url\n")
-                for h in self._history:
-                    row = [h.get("date", ""), h.get("time", ""), h.get("title", ""),
-                           h.get("status", ""), h.get("size", ""), h.get("quality", ""),
-                           h.get("url", "")]
-                    f.write(",".join(f'"{c.replace(chr(34), chr(34)*2)}"' for c in row) + "\n")
+                f.write("\n".join(lines) + "\n")
             return target
         except Exception:
             traceback.print_exc()
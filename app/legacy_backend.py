@@ -499,19 +499,26 @@ class OptimizedYoutubeDownloader:
         elapsed = time.time() - self.stats['start_time']
         success_rate = (self.stats['completed'] / self.stats['total'] * 100) if self.stats['total'] > 0 else 0
         
-        print("\n" + "="*70)
-        print("DOWNLOAD STATISTICS")
-        print("="*70)
-        print(f"[OK] Completed: {self.stats['completed']}")
-        print(f"[SKIP] Skipped: {self.stats['skipped']}")
-        print(f"[FAIL] Failed: {self.stats['failed']}")
-        print(f"[INFO] Total: {self.stats['total']}")
-        print(f"[INFO] Success Rate: {success_rate:.1f}%")
-        print(f"[INFO] Downloaded: {self._format_bytes(self.stats['bytes_downloaded'])}")
-        print(f"[TIME] Time: {elapsed:.1f}s")
-        print(f"[SPEED] Speed: {self._format_bytes(self.stats['bytes_downloaded'] / elapsed)}/s")
-        print(f"[RATE] Videos/min: {(self.stats['completed'] + self.stats['skipped']) / elapsed * 60:.1f}")
-        print("="*70)
+        # Build the report up front and emit it in one write -- a print()
+        # per line is a separate console write each on Windows.
+        lines = [
+            "",
+            "="*70,
+            "DOWNLOAD STATISTICS",
+            "="*70,
+            f"[OK] Completed: {self.stats['completed']}",
+            f"[SKIP] Skipped: {self.stats['skipped']}",
+            f"[FAIL] Failed: {self.stats['failed']}",
+            f"[INFO] Total: {self.stats['total']}",
+            f"[INFO] Success Rate: {success_rate:.1f}%",
+            f"[INFO] Downloaded: {self._format_bytes(self.stats['bytes_downloaded'])}",
+            f"[TIME] Time: {elapsed:.1f}s",
+            f"[SPEED] Speed: {self._format_bytes(self.stats['bytes_downloaded'] / elapsed)}/s",
+            f"[RATE] Videos/min: {(self.stats['completed'] + self.stats['skipped']) / elapsed * 60:.1f}",
+            "="*70,
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
     
     @staticmethod
     def _format_bytes(bytes: int) -> str:
@@ -2,18 +2,26 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
 import threading
 import queue
+import platform
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 import asyncio
 import shutil
+import sqlite3
 import sys
 import os
+import time
 import warnings
 from pathlib import Path
 from datetime import datetime
 import json
 import re
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from typing import List, Dict, Optional
-import webbrowser
-from urllib.parse import urlparse, parse_qs
+from importlib.util import find_spec
+from urllib.parse import urlsplit
 
 # Suppress the pkg_resources deprecation warning
 warnings.filterwarnings("ignore", category=UserWarning, module="pkg_resources")
@@ -28,11 +36,18 @@ try:
 except ImportError:
     pass
 
-# Import our enhanced downloader
+# orjson is optional. When it's installed the analytics file (up to a
+# thousand history records) is serialized and parsed in C, several times
+# faster than the stdlib json module it otherwise falls back to.
 try:
-    from app.legacy_backend import OptimizedYoutubeDownloader
-    import yt_dlp
-except ImportError as e:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Make sure yt-dlp is installed without importing it yet: it pulls in
+# every extractor and takes a noticeable while to load, and nothing needs
+# it until the first URL is looked up. Those paths import it on demand.
+if find_spec("yt_dlp") is None:
     error_msg = "Required dependencies not found. Please install:\n\n"
     error_msg += "pip install yt-dlp aiohttp aiofiles tqdm\n\n"
     error_msg += "And make sure you're running from the repo root."
@@ -48,36 +63,350 @@ except ImportError as e:
     sys.exit(1)
 
 
+# A candidate URL in the multi-line input box: any run of non-whitespace.
+# clean_youtube_url decides later whether it's actually a YouTube link.
+_URL_TOKEN_RE = re.compile(r'\S+')
+
+# Recognised YouTube URL shapes, compiled once at import. validate_url runs
+# on every keystroke in the URL box, so the six forms share one anchored
+# alternation -- the scheme/www/host prefix is matched once rather than
+# per form -- and the named group that matched tells the caller which kind
+# of URL it is. IDs are plain ASCII, so re.ASCII keeps \w to [A-Za-z0-9_]
+# instead of the Unicode word tables. IGNORECASE lets a mixed-case host
+# (WWW.YouTube.com) through; the ID classes already cover both cases.
+_YOUTUBE_URL_RE = re.compile(
+    r'\A(?:https?://)?'
+    r'(?:(?:www\.)?youtube\.com/'
+    r'(?:watch\?v=(?P<video>[\w-]+)'
+    r'|playlist\?list=(?P<playlist>[\w-]+)'
+    r'|channel/(?P<channel>[\w-]+)'
+    r'|c/(?P<custom>[\w-]+)'
+    r'|@(?P<handle>[\w-]+))'
+    r'|youtu\.be/(?P<short>[\w-]+))',
+    re.ASCII | re.IGNORECASE,
+)
+
+# Video ID / playlist ID extraction used by clean_youtube_url. Each is a
+# single alternation, so a URL is searched once per kind rather than once
+# per shape.
+_VIDEO_ID_RE = re.compile(
+    r'(?:youtube\.com/(?:watch\?v=|embed/|v/)|youtu\.be/)([\w-]{11})',
+    re.ASCII | re.IGNORECASE,
+)
+_PLAYLIST_RE = re.compile(
+    r'youtube\.com/(?:playlist\?list=|watch\?.*list=)([\w-]+)',
+    re.ASCII | re.IGNORECASE,
+)
+
+# Home directory and default download folder, resolved once at import.
+# Path.home() goes back to the environment (or the user database) on every
+# call, and the default folder is needed at startup and again on reset.
+_HOME = Path.home()
+_DEFAULT_DOWNLOAD_DIR = str(_HOME / "Downloads" / "YouTube")
+
+# Host OS, for picking the file manager command. Looked up once rather
+# than on every Open click.
+_SYSTEM = platform.system()
+
+# Open a folder in the system file manager, or with select=True show a
+# file highlighted in its folder. The variant is picked once for the OS.
+if _SYSTEM == "Windows":
+    def _open_path(path: str, select: bool = False):
+        subprocess.run(["explorer", "/select,", path] if select else ["explorer", path])
+elif _SYSTEM == "Darwin":  # macOS
+    def _open_path(path: str, select: bool = False):
+        subprocess.run(["open", "-R", path] if select else ["open", path])
+else:  # Linux
+    def _open_path(path: str, select: bool = False):
+        # xdg-open can't highlight a file, so open its folder instead
+        subprocess.run(["xdg-open", str(Path(path).parent) if select else path])
+
+# A size column value ("12.3 MB") and its unit's size in MB
+_SIZE_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(GB|MB|KB)')
+_SIZE_UNITS_MB = {'GB': 1024.0, 'MB': 1.0, 'KB': 1 / 1024}
+
+# Download records kept in the analytics history
+_MAX_HISTORY = 1000
+
+# Columns of the download queue tree, in display order
+_QUEUE_COLUMNS = ('Status', 'Title', 'Duration', 'Uploader', 'Progress', 'Speed', 'ETA', 'Size')
+
+# Status column text for each queue status; anything else shows as-is
+_STATUS_DISPLAY = {
+    "Completed": "✅ Completed",
+    "Failed": "❌ Failed",
+    "Downloading": "⬇️ Downloading",
+    "Pending": "⏳ Pending",
+    "Loading Info": "🔄 Loading Info",
+    "Info Failed": "❌ Info Failed",
+    "Unavailable": "🚫 Unavailable",
+    "Error": "⚠️ Error",
+}
+
+# Text progress bars for the Progress column, one per 5% step, built once
+# rather than per progress tick
+_BARS = tuple('█' * filled + '░' * (20 - filled) for filled in range(21))
+
+# yt-dlp format selectors tried in turn for each quality setting, from
+# the closest match down to whatever the video offers
+_FORMAT_CHAINS = {
+    "best": (
+        "best[height<=1080][ext=mp4]",
+        "best[height<=1080]",
+        "best[ext=mp4]",
+        "best",
+    ),
+    "best[height<=1080p]": (
+        "best[height<=1080][ext=mp4]",
+        "best[height<=1080]",
+        "best[ext=mp4]",
+        "best",
+    ),
+    "best[height<=720p]": (
+        "best[height<=720][ext=mp4]",
+        "best[height<=720]",
+        "best[height<=1080][ext=mp4]",
+        "best[ext=mp4]",
+        "best",
+    ),
+    "best[height<=480p]": (
+        "best[height<=480][ext=mp4]",
+        "best[height<=480]",
+        "best[height<=720][ext=mp4]",
+        "best[ext=mp4]",
+        "best",
+    ),
+    "best[height<=360p]": (
+        "best[height<=360][ext=mp4]",
+        "best[height<=360]",
+        "best[height<=480][ext=mp4]",
+        "best[ext=mp4]",
+        "best",
+    ),
+    "worst": (
+        "worst[ext=mp4]",
+        "worst",
+    ),
+}
+
+# Extensions of the files a finished download can leave behind
+_VIDEO_EXTENSIONS = ('.mp4', '.webm', '.mkv', '.mp3', '.m4a')
+
+# Byte units, largest first, for picking the suffix of a size or speed
+_KB, _MB, _GB = 1 << 10, 1 << 20, 1 << 30
+_SIZE_UNITS = ((_GB, "GB"), (_MB, "MB"))
+
+# Initial main window size; main() centers the window using the same value
+_WINDOW_SIZE = (1200, 800)
+
+# Hint text shown in the empty URL inputs
+_URL_ENTRY_PLACEHOLDER = "Paste YouTube URL here (video, playlist, or channel)"
+_URL_TEXT_PLACEHOLDER = "Enter multiple YouTube URLs (one per line)"
+
+# Hostnames clean_youtube_url accepts
+_YT_HOSTS = frozenset({
+    'youtube.com',
+    'www.youtube.com',
+    'm.youtube.com',
+    'music.youtube.com',
+    'youtu.be',
+})
+
+
+def canonical_video_url(url: str) -> Optional[str]:
+    """Return the canonical watch URL for a plain single-video link.
+
+    Returns None for playlists, channels, and video links that also carry
+    a playlist (yt-dlp expands those to the whole list).
+    """
+    match = _YOUTUBE_URL_RE.match(url)
+    if match and match.lastgroup in ('video', 'short') and 'list=' not in url:
+        return f"https://www.youtube.com/watch?v={match.group(match.lastgroup)}"
+    return None
+
+
+def _json_dumps(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON; deques (the download history) become lists"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=list, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, default=list).encode()
+    return json.dumps(obj, separators=(',', ':'), default=list).encode()
+
+
+def _json_loads(data: bytes):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+# Text for the speed, ETA and size columns. yt-dlp's progress hook fires
+# many times a second per download and mostly repeats the previous
+# values, so each helper takes an already-rounded number and the caches
+# hand back the same string instead of formatting a new one per tick.
+@lru_cache(maxsize=1024)
+def _format_rate(tenths: int, unit: str) -> str:
+    return f"{tenths / 10:.1f} {unit}"
+
+
+@lru_cache(maxsize=1024)
+def _format_eta(eta: int) -> str:
+    minutes, seconds = divmod(eta, 60)
+    if eta > 3600:
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+# Video lengths cluster heavily, so a large playlist mostly hits the cache
+@lru_cache(maxsize=4096)
+def _format_duration(seconds: int) -> str:
+    """Format duration in seconds to readable format"""
+    if not seconds:
+        return ""
+
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+
+    if hours > 0:
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    else:
+        return f"{minutes:02d}:{seconds:02d}"
+
+
+@lru_cache(maxsize=256)
+def _format_size(total: int) -> str:
+    for unit_bytes, unit in _SIZE_UNITS:
+        if total >= unit_bytes:
+            return f"{total / unit_bytes:.1f} {unit}"
+    return f"{total / _KB:.1f} KB"
+
+
+class MetadataCache:
+    """Video metadata kept on disk between runs, keyed by YouTube video ID.
+
+    Re-adding a video that was looked up recently is answered from here
+    instead of another yt-dlp round trip. Entries expire after MAX_AGE
+    seconds and the least recently used are dropped past MAX_ENTRIES. The
+    cache is best-effort: any SQLite error just means a miss.
+    """
+
+    MAX_ENTRIES = 2000
+    MAX_AGE = 7 * 24 * 60 * 60
+    FIELDS = ('title', 'duration', 'uploader', 'view_count')
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        """Open the database on first use (call with the lock held)"""
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS meta ('
+                'video_id TEXT PRIMARY KEY, json TEXT NOT NULL, '
+                'fetched INTEGER NOT NULL, used INTEGER NOT NULL)')
+        return self._conn
+
+    def get_many(self, video_ids: List[str]) -> Dict[str, Dict]:
+        """Return {video_id: info} for the IDs with a fresh cached entry"""
+        now = int(time.time())
+        found = {}
+        try:
+            with self._lock:
+                conn = self._connect()
+                # Stay under SQLite's bound-parameter limit on big pastes
+                for start in range(0, len(video_ids), 500):
+                    chunk = video_ids[start:start + 500]
+                    marks = ','.join('?' * len(chunk))
+                    rows = conn.execute(
+                        f'SELECT video_id, json FROM meta WHERE fetched > ? AND video_id IN ({marks})',
+                        (now - self.MAX_AGE, *chunk))
+                    for video_id, data in rows:
+                        info = json.loads(data)
+                        info['id'] = video_id
+                        found[video_id] = info
+                if found:
+                    conn.executemany('UPDATE meta SET used = ? WHERE video_id = ?',
+                                     [(now, video_id) for video_id in found])
+                    conn.commit()
+        except (sqlite3.Error, ValueError):
+            return {}
+        return found
+
+    def put_many(self, infos: List[Dict]):
+        """Store yt-dlp info dicts for single videos, then trim to MAX_ENTRIES"""
+        now = int(time.time())
+        # Missing fields are left out so the loader's defaults still apply
+        rows = [(info['id'],
+                 json.dumps({field: info[field] for field in self.FIELDS if info.get(field) is not None}),
+                 now, now)
+                for info in infos if info.get('id')]
+        if not rows:
+            return
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.executemany('INSERT OR REPLACE INTO meta VALUES (?, ?, ?, ?)', rows)
+                conn.execute('DELETE FROM meta WHERE video_id NOT IN '
+                             '(SELECT video_id FROM meta ORDER BY used DESC, rowid DESC LIMIT ?)',
+                             (self.MAX_ENTRIES,))
+                conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def clear(self):
+        """Drop every cached entry"""
+        with self._lock:
+            conn = self._connect()
+            conn.execute('DELETE FROM meta')
+            conn.commit()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Slotted: a long playlist creates thousands of these, and the progress
+# hook rewrites several fields many times a second. eq=False keeps the
+# identity comparison (and hashing) a plain class has.
+@dataclass(slots=True, eq=False)
 class VideoInfo:
     """Enhanced video information class"""
 
-    def __init__(self, url: str, title: str = "Unknown", duration: str = "",
-                 thumbnail: str = "", uploader: str = "", view_count: int = 0,
-                 upload_date: str = "", description: str = "", format_info: str = "", status: str = "Pending"):
-        self.url = url
-        self.title = title
-        self.duration = duration
-        self.thumbnail = thumbnail
-        self.uploader = uploader
-        self.view_count = view_count
-        self.upload_date = upload_date
-        self.description = description
-        self.format_info = format_info
-        self.status = status
-        self.progress = 0
-        self.speed = ""
-        self.eta = ""
-        self.size = ""
-        self.error = ""
-        self.file_path = ""
-        self.tree_item_id = None  # Store reference to tree item
+    url: str
+    title: str = "Unknown"
+    duration: str = ""
+    thumbnail: str = ""
+    uploader: str = ""
+    view_count: int = 0
+    upload_date: str = ""
+    description: str = ""
+    format_info: str = ""
+    status: str = "Pending"
+    progress: int = field(default=0, init=False)
+    speed: str = field(default="", init=False)
+    eta: str = field(default="", init=False)
+    size: str = field(default="", init=False)
+    error: str = field(default="", init=False)
+    file_path: str = field(default="", init=False)
+    tree_item_id: Optional[str] = field(default=None, init=False)  # Store reference to tree item
+    # Status the queue stats currently tally this item under
+    counted_status: Optional[str] = field(default=None, init=False)
+    # Column values last written to this item's queue row
+    shown_values: tuple = field(default=(), init=False)
+    # When (monotonic) and at what percent the last progress tick was posted
+    last_emit_ts: float = field(default=0.0, init=False)
+    last_emit_pct: float = field(default=0.0, init=False)
 
 
 class YouTubeDownloaderGUI:
     def __init__(self, root):
         self.root = root
         self.root.title("YouTube Downloader Pro - Enhanced")
-        self.root.geometry("1200x800")
+        self.root.geometry("{}x{}".format(*_WINDOW_SIZE))
         self.root.minsize(900, 600)
 
         # Set icon (if available)
@@ -87,7 +416,7 @@ class YouTubeDownloaderGUI:
             pass
 
         # Variables
-        self.download_dir = tk.StringVar(value=str(Path.home() / "Downloads" / "YouTube"))
+        self.download_dir = tk.StringVar(value=_DEFAULT_DOWNLOAD_DIR)
         self.max_concurrent = tk.IntVar(value=3)
         self.video_quality = tk.StringVar(value="best")
         self.save_descriptions = tk.BooleanVar(value=False)
@@ -96,17 +425,104 @@ class YouTubeDownloaderGUI:
         # (chrome / edge / firefox / brave / opera / vivaldi / safari).
         # Needed when YouTube's anti-bot check fires on a request.
         self.cookies_browser = tk.StringVar(value="none")
+        self.retry_attempts = tk.IntVar(value=3)
+        self.timeout_seconds = tk.IntVar(value=30)
 
         # Data
         self.download_queue = []
+        # Queued videos by their tree row iid, so acting on the selected
+        # rows is a dict lookup rather than a scan of the whole queue
+        self._items_by_tree_id: Dict[str, VideoInfo] = {}
+        # URLs of everything in download_queue, for O(1) duplicate checks
+        self._queue_urls = set()
+        # Bumped by Clear All so row chunks still waiting in after_idle
+        # from an earlier paste know to stop
+        self._queue_generation = 0
+        # Status shown by the queue filter buttons; None shows every row
+        self._queue_filter = None
         self.is_downloading = False
         self.is_loading_info = False
         self.message_queue = queue.Queue()
-        self.progress_queue = queue.Queue()
+        # Latest progress per bar / per video, filled by download threads
+        # and swapped out whole by process_progress. Newer ticks overwrite
+        # older ones, so it never holds more than the overall bar plus one
+        # entry per queued video however fast yt-dlp reports.
+        self._progress_pending = {}
+        self._progress_lock = threading.Lock()
+        # Videos currently transferring (guarded by _progress_lock). With
+        # several downloads at once the "current" bar shows their mean
+        # progress rather than whichever one ticked last.
+        self._active_downloads = set()
+        # Metadata loads still running (guarded by _progress_lock), so the
+        # message poll stays fast until their results are in
+        self._loads_running = 0
+
+        # Running per-status tallies of the rows in the queue, kept on the
+        # UI thread so the stats line doesn't rescan the whole queue
+        self._status_counts = Counter()
+        # Text the stats line last showed
+        self._queue_stats_text = None
+
+        # Settings file location, resolved once rather than on every save/load
+        self.settings_file = _HOME / '.youtube_downloader_enhanced_settings.json'
+
+        # Metadata of recently looked-up videos, so re-adding them skips yt-dlp
+        self._meta_cache = MetadataCache(_HOME / '.youtube_downloader_metadata.db')
+
+        # Last settings written to disk, so unchanged saves can be skipped
+        self._last_saved_settings = None
+        # Pending after() id for a debounced save
+        self._settings_save_after = None
+        # Writes settings.json off the UI thread. One worker keeps the
+        # writes in order and off each other's temp file.
+        self._settings_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='settings')
+        # Pending after() id for debounced URL validation
+        self._validate_after = None
+        # Pending after() id for auto-adding the last validated URL
+        self._auto_add_after = None
+
+        # Set by Stop; checked from yt-dlp's progress hook on the download threads
+        self._cancel_event = threading.Event()
+
+        # Background asyncio loop for downloads, created on first Start
+        self._event_loop = None
+
+        # Threads for blocking yt-dlp metadata lookups; load_urls bounds
+        # how many run at once (no thread is started until first use)
+        self._info_executor = ThreadPoolExecutor(max_workers=10, thread_name_prefix='yt-info')
+        # Threads that run the yt-dlp downloads themselves, reused across
+        # videos and batches. Sized to the Max Concurrent ceiling; the
+        # batch's consumer count decides how many are busy at once.
+        self._download_executor = ThreadPoolExecutor(max_workers=10, thread_name_prefix='yt-download')
+
+        # Set while a download batch runs so videos added mid-batch can join it
+        self._download_loop = None
+        self._download_queue_aio = None
+        self._download_total = 0
+        # Future of the last batch handed to the loop. After Stop it keeps
+        # running until its in-flight transfers unwind, and no new batch
+        # may start before it's done.
+        self._batch_future = None
+
+        # Whole percent each progress bar last showed, so redraws can be
+        # skipped until the value visibly moves
+        self._shown_progress = {'overall': 0, 'current': 0}
 
         # Analytics tracking with persistent storage
-        self.analytics_file = Path.home() / '.youtube_downloader_analytics.json'
+        self.analytics_file = _HOME / '.youtube_downloader_analytics.json'
         self.analytics = self.load_analytics()
+        self._analytics_lock = threading.Lock()
+        self._analytics_write_q = queue.Queue()
+        self._analytics_thread = threading.Thread(target=self.analytics_writer, daemon=True,
+                                                  name='analytics-writer')
+        self._analytics_thread.start()
+
+        # The last 100 activity lines. The Analytics tab's text box only
+        # mirrors them while that tab is showing; otherwise logging is just
+        # an append here, and the box is redrawn from it when next shown.
+        self._activity_log = deque(maxlen=100)
+        self._activity_visible = False
+        self._activity_stale = False
 
         # Current session tracking
         self.current_session = {
@@ -115,22 +531,15 @@ class YouTubeDownloaderGUI:
             'data_this_session': 0
         }
 
-        # Validation patterns
-        self.youtube_patterns = [
-            r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]+)',
-            r'(?:https?://)?(?:www\.)?youtube\.com/playlist\?list=([a-zA-Z0-9_-]+)',
-            r'(?:https?://)?youtu\.be/([a-zA-Z0-9_-]+)',
-            r'(?:https?://)?(?:www\.)?youtube\.com/channel/([a-zA-Z0-9_-]+)',
-            r'(?:https?://)?(?:www\.)?youtube\.com/c/([a-zA-Z0-9_-]+)',
-            r'(?:https?://)?(?:www\.)?youtube\.com/@([a-zA-Z0-9_-]+)'
-        ]
-
         # Create UI
         self.create_widgets()
 
-        # Start message processors
-        self.process_messages()
-        self.process_progress()
+        # Start message processors. Worker threads never call into Tk; one
+        # adaptive after() timer drains both queues on the UI thread, fast
+        # while there's work in flight and once a second when idle.
+        self._poll_after = None
+        self._idle_polls = 0
+        self.poll_messages()
 
         # Load settings
         self.load_settings()
@@ -182,6 +591,7 @@ class YouTubeDownloaderGUI:
         try:
             style.configure('Valid.TEntry', fieldbackground='#e8f5e8', borderwidth=2)
             style.configure('Invalid.TEntry', fieldbackground='#ffe8e8', borderwidth=2)
+            style.configure('Placeholder.TEntry', foreground='#999999')
         except:
             pass
 
@@ -252,9 +662,26 @@ class YouTubeDownloaderGUI:
         self.analytics_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.analytics_frame, text="📊 Analytics")
 
+        # Only the Download tab is built up front. Settings and Analytics
+        # are dozens of widgets most sessions never look at, so each is
+        # built the first time its tab is selected.
         self.create_main_tab()
-        self.create_settings_tab()
-        self.create_analytics_tab()
+        self._tab_builders = {
+            str(self.settings_frame): self.create_settings_tab,
+            str(self.analytics_frame): self.create_analytics_tab,
+        }
+        self.notebook.bind('<<NotebookTabChanged>>', self.on_tab_changed)
+
+    def on_tab_changed(self, event=None):
+        """Build a lazily created tab the first time it's shown"""
+        selected = self.notebook.select()
+        build = self._tab_builders.pop(selected, None)
+        if build is not None:
+            build()
+
+        self._activity_visible = selected == str(self.analytics_frame)
+        if self._activity_visible and self._activity_stale:
+            self.render_activity()
 
     def create_main_tab(self):
         """Create main download tab with modern design"""
@@ -279,14 +706,16 @@ class YouTubeDownloaderGUI:
         # URL entry with modern styling
         self.url_entry = ttk.Entry(url_input_frame, width=60)
         self.url_entry.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(5, 0))
-        self.url_entry.bind('<KeyRelease>', self.validate_url)
+        self.url_entry.bind('<KeyRelease>', self.schedule_validate_url)
         self.url_entry.bind('<FocusOut>', self.on_url_focus_out)
         self.url_entry.bind('<Return>', lambda e: self.add_to_queue())
 
-        # Add placeholder text
-        self.url_entry.insert(0, "Paste YouTube URL here (video, playlist, or channel)")
+        # Add placeholder text. Its grey comes from a style (and a text tag
+        # in the batch box below), so showing or clearing the hint swaps
+        # one style name instead of restyling the widget's foreground.
+        self.url_entry.insert(0, _URL_ENTRY_PLACEHOLDER)
         self.url_entry.bind('<FocusIn>', self.on_url_entry_focus)
-        self.url_entry.configure(foreground='#999999')
+        self.url_entry.configure(style='Placeholder.TEntry')
 
         # Validation indicator with modern styling
         self.validation_label = ttk.Label(url_input_frame, text="", font=('Segoe UI', 9))
@@ -306,11 +735,12 @@ class YouTubeDownloaderGUI:
         text_frame.columnconfigure(0, weight=1)
         text_frame.rowconfigure(0, weight=1)
 
-        self.url_text = scrolledtext.ScrolledText(text_frame, height=4, width=50, wrap=tk.WORD)
+        self.url_text = scrolledtext.ScrolledText(text_frame, height=4, width=50, wrap=tk.WORD,
+                                                  foreground='#333333')
         self.url_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        self.url_text.insert("1.0", "Enter multiple YouTube URLs (one per line)")
+        self.url_text.tag_configure('placeholder', foreground='#999999')
+        self.url_text.insert("1.0", _URL_TEXT_PLACEHOLDER, 'placeholder')
         self.url_text.bind("<FocusIn>", self.on_url_text_focus)
-        self.url_text.configure(foreground='#999999')
 
         # Modern action buttons with icons
         button_frame = ttk.Frame(input_card)
@@ -333,7 +763,8 @@ class YouTubeDownloaderGUI:
         quick_frame.grid(row=3, column=1, sticky=tk.W, pady=(10, 0))
 
         self.auto_load_check = ttk.Checkbutton(quick_frame, text="🚀 Auto-load video info",
-                                               variable=self.auto_load_info)
+                                               variable=self.auto_load_info,
+                                               command=self.schedule_settings_save)
         self.auto_load_check.pack(side=tk.LEFT)
 
         # Download Queue Section with integrated progress overview
@@ -379,26 +810,28 @@ class YouTubeDownloaderGUI:
         overall_frame.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(10, 0))
         overall_frame.columnconfigure(0, weight=1)
 
-        self.overall_progress_var = tk.DoubleVar()
-        self.overall_progress_bar = ttk.Progressbar(overall_frame, variable=self.overall_progress_var,
-                                                    maximum=100, mode='determinate', length=300)
+        # The bars, like the status label below, are written directly with
+        # configure() rather than through a Tk variable: they're updated
+        # for every progress drain, and a variable adds a Tcl trace hop to
+        # each write.
+        self.overall_progress_bar = ttk.Progressbar(overall_frame, maximum=100,
+                                                    mode='determinate', length=300)
         self.overall_progress_bar.grid(row=0, column=0, sticky=(tk.W, tk.E))
 
         self.overall_progress_label = ttk.Label(overall_frame, text="0%",
                                                 font=('Segoe UI', 9, 'bold'))
         self.overall_progress_label.grid(row=0, column=1, padx=(10, 0))
 
-        # Current download progress
-        ttk.Label(progress_overview_frame, text="⬇️ Current Download:",
+        # Mean progress of the downloads running right now
+        ttk.Label(progress_overview_frame, text="⬇️ Active Downloads:",
                   font=('Segoe UI', 10, 'bold')).grid(row=1, column=0, sticky=tk.W, pady=(8, 0))
 
         current_frame = ttk.Frame(progress_overview_frame)
         current_frame.grid(row=1, column=1, sticky=(tk.W, tk.E), padx=(10, 0), pady=(8, 0))
         current_frame.columnconfigure(0, weight=1)
 
-        self.current_progress_var = tk.DoubleVar()
-        self.current_progress_bar = ttk.Progressbar(current_frame, variable=self.current_progress_var,
-                                                    maximum=100, mode='determinate', length=300)
+        self.current_progress_bar = ttk.Progressbar(current_frame, maximum=100,
+                                                    mode='determinate', length=300)
         self.current_progress_bar.grid(row=0, column=0, sticky=(tk.W, tk.E))
 
         self.current_progress_label = ttk.Label(current_frame, text="0%",
@@ -411,7 +844,7 @@ class YouTubeDownloaderGUI:
         tree_frame.columnconfigure(0, weight=1)
         tree_frame.rowconfigure(0, weight=1)
 
-        columns = ('Status', 'Title', 'Duration', 'Uploader', 'Progress', 'Speed', 'ETA', 'Size')
+        columns = _QUEUE_COLUMNS
         try:
             self.queue_tree = ttk.Treeview(tree_frame, columns=columns, show='tree headings',
                                            height=12, style='Modern.Treeview')
@@ -485,8 +918,6 @@ class YouTubeDownloaderGUI:
                                            command=self.clear_all)
         self.clear_all_button.pack(side=tk.LEFT, padx=4)
 
-        print("Control buttons created successfully")  # Debug print
-
         # Status bar with modern styling (moved to bottom of main frame)
         status_frame = ttk.Frame(main_frame)
         status_frame.grid(row=2, column=0, sticky=(tk.W, tk.E), pady=(10, 0))
@@ -494,10 +925,9 @@ class YouTubeDownloaderGUI:
 
         ttk.Label(status_frame, text="📋", font=('Segoe UI', 12)).grid(row=0, column=0, padx=(0, 5))
 
-        self.status_var = tk.StringVar(value="Ready to download")
-        status_label = ttk.Label(status_frame, textvariable=self.status_var,
-                                 font=('Segoe UI', 10), foreground='#666666')
-        status_label.grid(row=0, column=1, sticky=tk.W)
+        self.status_label = ttk.Label(status_frame, text="Ready to download",
+                                      font=('Segoe UI', 10), foreground='#666666')
+        self.status_label.grid(row=0, column=1, sticky=tk.W)
 
     def create_settings_tab(self):
         """Create settings tab with modern design"""
@@ -551,12 +981,15 @@ class YouTubeDownloaderGUI:
                                              "best[height<=480p]", "best[height<=360p]", "worst"],
                                      state="readonly", width=20)
         quality_combo.grid(row=0, column=1, sticky=tk.W, padx=(10, 0))
+        quality_combo.bind('<<ComboboxSelected>>', self.schedule_settings_save)
 
         ttk.Label(quality_frame, text="⚡ Concurrent Downloads:",
                   font=('Segoe UI', 10, 'bold')).grid(row=1, column=0, sticky=tk.W, pady=(10, 0))
 
         concurrent_spin = ttk.Spinbox(quality_frame, from_=1, to=10,
-                                      textvariable=self.max_concurrent, width=15)
+                                      textvariable=self.max_concurrent, width=15,
+                                      command=self.schedule_settings_save)
+        concurrent_spin.bind('<FocusOut>', self.schedule_settings_save)
         concurrent_spin.grid(row=1, column=1, sticky=tk.W, padx=(10, 0), pady=(10, 0))
 
         # Behavior Settings Card
@@ -567,11 +1000,13 @@ class YouTubeDownloaderGUI:
         options_frame.grid(row=0, column=0, sticky=(tk.W, tk.E))
 
         desc_check = ttk.Checkbutton(options_frame, text="📝 Save video descriptions",
-                                     variable=self.save_descriptions)
+                                     variable=self.save_descriptions,
+                                     command=self.schedule_settings_save)
         desc_check.grid(row=0, column=0, sticky=tk.W, pady=5)
 
         auto_check = ttk.Checkbutton(options_frame, text="🚀 Auto-load video information",
-                                     variable=self.auto_load_info)
+                                     variable=self.auto_load_info,
+                                     command=self.schedule_settings_save)
         auto_check.grid(row=1, column=0, sticky=tk.W, pady=5)
 
         # Advanced Settings Card
@@ -585,17 +1020,19 @@ class YouTubeDownloaderGUI:
         ttk.Label(advanced_frame, text="🔄 Retry attempts:",
                   font=('Segoe UI', 10, 'bold')).grid(row=0, column=0, sticky=tk.W)
 
-        self.retry_attempts = tk.IntVar(value=3)
         retry_spin = ttk.Spinbox(advanced_frame, from_=1, to=10,
-                                 textvariable=self.retry_attempts, width=15)
+                                 textvariable=self.retry_attempts, width=15,
+                                 command=self.schedule_settings_save)
+        retry_spin.bind('<FocusOut>', self.schedule_settings_save)
         retry_spin.grid(row=0, column=1, sticky=tk.W, padx=(10, 0))
 
         ttk.Label(advanced_frame, text="⏱️ Timeout (seconds):",
                   font=('Segoe UI', 10, 'bold')).grid(row=1, column=0, sticky=tk.W, pady=(10, 0))
 
-        self.timeout_seconds = tk.IntVar(value=30)
         timeout_spin = ttk.Spinbox(advanced_frame, from_=10, to=120,
-                                   textvariable=self.timeout_seconds, width=15)
+                                   textvariable=self.timeout_seconds, width=15,
+                                   command=self.schedule_settings_save)
+        timeout_spin.bind('<FocusOut>', self.schedule_settings_save)
         timeout_spin.grid(row=1, column=1, sticky=tk.W, padx=(10, 0), pady=(10, 0))
 
         ttk.Label(advanced_frame, text="🍪 Cookies from browser:",
@@ -609,6 +1046,7 @@ class YouTubeDownloaderGUI:
             width=13,
         )
         cookies_combo.grid(row=2, column=1, sticky=tk.W, padx=(10, 0), pady=(10, 0))
+        cookies_combo.bind('<<ComboboxSelected>>', self.schedule_settings_save)
 
         ttk.Label(
             advanced_frame,
@@ -633,6 +1071,9 @@ class YouTubeDownloaderGUI:
         ttk.Button(action_frame, text="📁 Open Download Folder",
                    command=self.open_download_folder).pack(side=tk.LEFT, padx=5)
 
+        ttk.Button(action_frame, text="🧹 Clear Metadata Cache",
+                   command=self.clear_metadata_cache).pack(side=tk.LEFT, padx=5)
+
     def create_analytics_tab(self):
         """Create analytics tab with download statistics"""
         analytics_frame = self.analytics_frame
@@ -692,8 +1133,10 @@ class YouTubeDownloaderGUI:
         # Activity list
         self.activity_text = scrolledtext.ScrolledText(activity_frame, height=8, wrap=tk.WORD)
         self.activity_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        self.activity_text.insert("1.0", "No recent activity")
-        self.activity_text.configure(state=tk.DISABLED)
+        # "No recent activity" is greyed like the URL box's hint text; the
+        # tag also lets log_activity find and drop it
+        self.activity_text.tag_configure('placeholder', foreground='#999999')
+        self.render_activity()
 
         # Load and display initial analytics
         try:
@@ -738,6 +1181,16 @@ class YouTubeDownloaderGUI:
             # Labels not created yet
             pass
 
+    def clear_metadata_cache(self):
+        """Forget every cached video lookup"""
+        try:
+            self._meta_cache.clear()
+        except sqlite3.Error as e:
+            messagebox.showerror("Cache Error", f"Failed to clear metadata cache:\n{str(e)}")
+            return
+        self.show_status("🧹 Metadata cache cleared")
+        self.log_activity("🧹 Metadata cache cleared")
+
     def create_stat_card(self, parent, title, value, row, col):
         """Create a statistics card"""
         card = ttk.LabelFrame(parent, text=title, padding="10")
@@ -749,21 +1202,6 @@ class YouTubeDownloaderGUI:
 
         return value_label
 
-    def log_activity(self, message):
-        """Log activity to analytics tab"""
-        try:
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            self.activity_text.configure(state=tk.NORMAL)
-            self.activity_text.insert("1.0", f"[{timestamp}] {message}\n")
-            # Keep only last 100 lines
-            lines = self.activity_text.get("1.0", tk.END).split('\n')
-            if len(lines) > 100:
-                self.activity_text.delete("100.0", tk.END)
-            self.activity_text.configure(state=tk.DISABLED)
-        except AttributeError:
-            # Activity text not created yet
-            pass
-
     def refresh_analytics(self):
         """Refresh analytics display"""
         self.update_analytics()
@@ -788,8 +1226,10 @@ class YouTubeDownloaderGUI:
                     'export_timestamp': datetime.now().isoformat()
                 }
 
-                with open(filename, 'w') as f:
-                    json.dump(export_data, f, indent=2)
+                with self._analytics_lock:
+                    data = _json_dumps(export_data, indent=True)
+                with open(filename, 'wb') as f:
+                    f.write(data)
 
                 self.log_activity(f"📤 Analytics exported to {Path(filename).name}")
                 messagebox.showinfo("Export Complete", f"Analytics exported to:\n{filename}")
@@ -801,15 +1241,18 @@ class YouTubeDownloaderGUI:
         """Clear analytics history after confirmation"""
         if messagebox.askyesno("Clear Analytics",
                                "Are you sure you want to clear all analytics history?\n\nThis action cannot be undone."):
-            self.analytics = {
+            now = datetime.now().isoformat()
+            analytics = {
                 'total_downloads': 0,
                 'successful_downloads': 0,
                 'failed_downloads': 0,
                 'total_data_downloaded': 0.0,
-                'first_use_date': datetime.now().isoformat(),
-                'last_update': datetime.now().isoformat(),
-                'download_history': []
+                'first_use_date': now,
+                'last_update': now,
+                'download_history': deque(maxlen=_MAX_HISTORY)
             }
+            with self._analytics_lock:
+                self.analytics = analytics
             self.save_analytics()
             self.update_analytics()
             self.log_activity("🗑️ Analytics history cleared")
@@ -827,24 +1270,28 @@ class YouTubeDownloaderGUI:
 
     def load_analytics(self):
         """Load analytics data from persistent storage"""
+        now = datetime.now().isoformat()
         default_analytics = {
             'total_downloads': 0,
             'successful_downloads': 0,
             'failed_downloads': 0,
             'total_data_downloaded': 0.0,  # in MB
-            'first_use_date': datetime.now().isoformat(),
-            'last_update': datetime.now().isoformat(),
-            'download_history': []  # List of download records
+            'first_use_date': now,
+            'last_update': now,
+            # Download records, newest last. A bounded deque drops the
+            # oldest on append instead of re-slicing a list past the cap.
+            'download_history': deque(maxlen=_MAX_HISTORY)
         }
 
         if self.analytics_file.exists():
             try:
-                with open(self.analytics_file, 'r') as f:
-                    data = json.load(f)
+                with open(self.analytics_file, 'rb') as f:
+                    data = _json_loads(f.read())
                 # Ensure all required keys exist
                 for key, default_value in default_analytics.items():
                     if key not in data:
                         data[key] = default_value
+                data['download_history'] = deque(data['download_history'], maxlen=_MAX_HISTORY)
                 return data
             except Exception as e:
                 print(f"Error loading analytics: {e}")
@@ -853,18 +1300,51 @@ class YouTubeDownloaderGUI:
             return default_analytics
 
     def save_analytics(self):
-        """Save analytics data to persistent storage"""
+        """Queue a save of the analytics data to persistent storage"""
+        self._analytics_write_q.put(True)
+
+    def analytics_writer(self):
+        """Background thread that writes analytics.json.
+
+        Saves are requested after every finished download. Doing them
+        here keeps the disk write off the UI and download threads. After
+        a request the writer waits half a second, so the other downloads
+        of a concurrent batch finishing around the same time collapse into
+        a single write. A False token asks for a final write and then
+        stops the thread.
+        """
+        keep_running = True
+        while keep_running:
+            keep_running = self._analytics_write_q.get()
+            if keep_running:
+                time.sleep(0.5)
+            try:
+                while True:
+                    keep_running = self._analytics_write_q.get_nowait() and keep_running
+            except queue.Empty:
+                pass
+            self.write_analytics()
+
+    def write_analytics(self):
+        """Write the analytics file atomically (temp file + os.replace)"""
         try:
-            self.analytics['last_update'] = datetime.now().isoformat()
-            with open(self.analytics_file, 'w') as f:
-                json.dump(self.analytics, f, indent=2)
+            with self._analytics_lock:
+                # Compact: the file is only read back by the app, and
+                # indenting 1000 history records roughly adds a third to
+                # the bytes serialized and written each time
+                data = _json_dumps(self.analytics)
+            tmp_file = self.analytics_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, self.analytics_file)
         except Exception as e:
             print(f"Error saving analytics: {e}")
 
     def record_download(self, video_info: VideoInfo, success: bool, file_size_mb: float = 0.0):
         """Record a download attempt with details"""
+        now = datetime.now().isoformat()
         download_record = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now,
             'title': video_info.title,
             'url': video_info.url,
             'uploader': video_info.uploader,
@@ -874,77 +1354,86 @@ class YouTubeDownloaderGUI:
             'error': video_info.error if not success else None
         }
 
-        # Update main analytics
-        if success:
-            self.analytics['successful_downloads'] += 1
-            self.analytics['total_data_downloaded'] += file_size_mb
-            self.current_session['downloads_this_session'] += 1
-            self.current_session['data_this_session'] += file_size_mb
-        else:
-            self.analytics['failed_downloads'] += 1
+        # Update main analytics (under the lock the writer thread
+        # serializes with)
+        with self._analytics_lock:
+            if success:
+                self.analytics['successful_downloads'] += 1
+                self.analytics['total_data_downloaded'] += file_size_mb
+                self.current_session['downloads_this_session'] += 1
+                self.current_session['data_this_session'] += file_size_mb
+            else:
+                self.analytics['failed_downloads'] += 1
 
-        self.analytics['total_downloads'] += 1
+            self.analytics['total_downloads'] += 1
+            self.analytics['last_update'] = now
 
-        # Add to history (keep last 1000 records)
-        self.analytics['download_history'].append(download_record)
-        if len(self.analytics['download_history']) > 1000:
-            self.analytics['download_history'] = self.analytics['download_history'][-1000:]
+            # Add to history; the deque keeps only the last _MAX_HISTORY
+            self.analytics['download_history'].append(download_record)
 
         # Save to file
         self.save_analytics()
 
-        # Update UI
-        self.update_analytics()
+        # Update UI -- this runs on the download thread, so let the UI
+        # thread touch the labels
+        self.post_message("update_analytics")
 
     def get_file_size_mb(self, file_path):
         """Get file size in MB"""
+        if not file_path:
+            return 0.0
+        # One stat call; a missing file is just the OSError
         try:
-            if file_path and Path(file_path).exists():
-                size_bytes = Path(file_path).stat().st_size
-                return size_bytes / (1024 * 1024)  # Convert to MB
-        except Exception:
-            pass
-        return 0.0
+            size_bytes = os.stat(file_path).st_size
+        except OSError:
+            return 0.0
+        return size_bytes / _MB
 
     def estimate_file_size_from_progress(self, video_info: VideoInfo):
         """Estimate file size from download progress data"""
-        try:
-            # If we have size info from progress
-            size_str = video_info.size
-            if size_str:
-                if 'GB' in size_str:
-                    return float(size_str.replace('GB', '').strip()) * 1024
-                elif 'MB' in size_str:
-                    return float(size_str.replace('MB', '').strip())
-                elif 'KB' in size_str:
-                    return float(size_str.replace('KB', '').strip()) / 1024
-        except Exception:
-            pass
+        # The size column holds what _format_size wrote, e.g. "12.3 MB"
+        match = _SIZE_RE.search(video_info.size or "")
+        if match:
+            return float(match.group(1)) * _SIZE_UNITS_MB[match.group(2)]
         return 0.0
-        """Update analytics display"""
-        try:
-            self.total_downloads_label.config(text=str(self.analytics['total_downloads']))
-            self.successful_downloads_label.config(text=str(self.analytics['successful_downloads']))
-            self.failed_downloads_label.config(text=str(self.analytics['failed_downloads']))
-            self.data_downloaded_label.config(text=f"{self.analytics['total_data_downloaded']:.1f} MB")
-        except AttributeError:
-            # Labels not created yet
-            pass
 
     def log_activity(self, message):
         """Log activity to analytics tab"""
-        try:
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            self.activity_text.configure(state=tk.NORMAL)
-            self.activity_text.insert("1.0", f"[{timestamp}] {message}\n")
-            # Keep only last 100 lines
-            lines = self.activity_text.get("1.0", tk.END).split('\n')
-            if len(lines) > 100:
-                self.activity_text.delete("100.0", tk.END)
-            self.activity_text.configure(state=tk.DISABLED)
-        except AttributeError:
-            # Activity text not created yet
-            pass
+        # time.strftime formats straight from the C clock, without building
+        # a datetime object first
+        timestamp = time.strftime("%H:%M:%S")
+        line = f"[{timestamp}] {message}\n"
+        self._activity_log.append(line)
+        if not self._activity_visible:
+            self._activity_stale = True
+            return
+        self.activity_text.configure(state=tk.NORMAL)
+        if self.activity_text.tag_ranges('placeholder'):
+            self.activity_text.delete("1.0", tk.END)
+        # Append, oldest at the top: inserting at the top would shift every
+        # existing line down on each message
+        self.activity_text.insert(tk.END, line)
+        # Keep only last 100 lines. Ask Tk for the last line number rather
+        # than copying the whole log into Python and splitting it to count.
+        # Every line ends in a newline, so the count includes an empty
+        # last line.
+        line_count = int(self.activity_text.index('end-1c').split('.')[0])
+        if line_count > 101:
+            self.activity_text.delete("1.0", f"{line_count - 100}.0")
+        self.activity_text.see(tk.END)
+        self.activity_text.configure(state=tk.DISABLED)
+
+    def render_activity(self):
+        """Redraw the activity box from the activity log in one insert"""
+        self.activity_text.configure(state=tk.NORMAL)
+        self.activity_text.delete("1.0", tk.END)
+        if self._activity_log:
+            self.activity_text.insert(tk.END, ''.join(self._activity_log))
+            self.activity_text.see(tk.END)
+        else:
+            self.activity_text.insert("1.0", "No recent activity", 'placeholder')
+        self.activity_text.configure(state=tk.DISABLED)
+        self._activity_stale = False
 
     def create_context_menu(self):
         """Create context menu for queue"""
@@ -964,23 +1453,43 @@ class YouTubeDownloaderGUI:
             self.queue_tree.selection_set(item)
             self.context_menu.post(event.x_root, event.y_root)
 
+    def schedule_validate_url(self, event=None):
+        """Validate the URL entry once typing pauses for 150 ms.
+
+        Bound to <KeyRelease>: typing a URL by hand would otherwise rerun
+        the regex and restyle the entry and label on every keystroke.
+        """
+        if self._validate_after is not None:
+            self.root.after_cancel(self._validate_after)
+        self._validate_after = self.root.after(150, self.validate_url)
+
     def validate_url(self, event=None):
         """Enhanced URL validation with automatic adding to queue"""
+        # Called directly (e.g. by paste_urls) the debounced run may still
+        # be scheduled; cancel it so validation and auto-add happen once
+        if self._validate_after is not None:
+            self.root.after_cancel(self._validate_after)
+            self._validate_after = None
+        # Only the newest validation may auto-add; an edit supersedes it
+        if self._auto_add_after is not None:
+            self.root.after_cancel(self._auto_add_after)
+            self._auto_add_after = None
         url = self.url_entry.get().strip()
 
         # Don't validate placeholder text
-        if not url or url == "Paste YouTube URL here (video, playlist, or channel)":
+        if not url or url == _URL_ENTRY_PLACEHOLDER:
             self.validation_label.config(text="", style='TLabel')
-            self.url_entry.config(style='TEntry')
+            self.url_entry.config(style='Placeholder.TEntry' if url else 'TEntry')
             return
 
-        is_valid = any(re.match(pattern, url) for pattern in self.youtube_patterns)
+        match = _YOUTUBE_URL_RE.match(url)
 
-        if is_valid:
+        if match:
             # Determine URL type for better feedback
-            if 'playlist' in url.lower():
+            kind = match.lastgroup
+            if kind == 'playlist':
                 self.validation_label.config(text="✅ Valid Playlist URL - Will add all videos", style='Success.TLabel')
-            elif 'channel' in url.lower() or '/@' in url:
+            elif kind in ('channel', 'custom', 'handle'):
                 self.validation_label.config(text="✅ Valid Channel URL", style='Success.TLabel')
             else:
                 self.validation_label.config(text="✅ Valid Video URL", style='Success.TLabel')
@@ -992,7 +1501,7 @@ class YouTubeDownloaderGUI:
 
             # Auto-load info and add to queue if enabled
             if self.auto_load_info.get() and not self.is_loading_info:
-                self.root.after(1500, lambda: self.auto_add_validated_url(url))
+                self._auto_add_after = self.root.after(1500, self.auto_add_validated_url, url)
         else:
             self.validation_label.config(text="❌ Invalid YouTube URL", style='Error.TLabel')
             try:
@@ -1002,6 +1511,7 @@ class YouTubeDownloaderGUI:
 
     def auto_add_validated_url(self, url):
         """Automatically add validated URL to queue"""
+        self._auto_add_after = None
         if self.url_entry.get().strip() == url:  # Only if URL hasn't changed
             self.add_to_queue()
 
@@ -1011,84 +1521,138 @@ class YouTubeDownloaderGUI:
 
     def on_url_text_focus(self, event):
         """Clear placeholder text when multi-URL text widget is focused"""
-        content = self.url_text.get("1.0", "end-1c")
-        if content == "Enter multiple YouTube URLs (one per line)":
+        if self.url_text.tag_ranges('placeholder'):
             self.url_text.delete("1.0", tk.END)
-            self.url_text.configure(foreground='#333333')
 
     def on_url_entry_focus(self, event):
         """Handle URL entry focus in"""
-        if self.url_entry.get() == "Paste YouTube URL here (video, playlist, or channel)":
+        if self.url_entry.get() == _URL_ENTRY_PLACEHOLDER:
             self.url_entry.delete(0, tk.END)
-            self.url_entry.configure(foreground='#333333')
+            self.url_entry.configure(style='TEntry')
 
     def filter_queue(self, filter_type):
         """Filter queue display by status"""
-        # This would implement filtering logic
-        # For now, just update the stats
+        self._queue_filter = {"pending": "Pending", "completed": "Completed"}.get(filter_type)
+
+        # Hidden rows are detached rather than deleted, so they keep their
+        # values and come back with a move instead of being rebuilt
+        shown = []
+        hidden = []
+        for item in self.download_queue:
+            if item.tree_item_id:
+                # counted_status is the status the row currently shows;
+                # update_queue_item re-filters the row when it moves on
+                if self._queue_filter is None or item.counted_status == self._queue_filter:
+                    shown.append(item.tree_item_id)
+                else:
+                    hidden.append(item.tree_item_id)
+
+        if hidden:
+            self.queue_tree.detach(*hidden)
+        for index, item_id in enumerate(shown):
+            self.queue_tree.move(item_id, '', index)
+
         self.update_queue_stats()
 
+    def refilter_row(self, video_info: VideoInfo, old_status: Optional[str]):
+        """Hide or show a row whose status changed under an active filter"""
+        status_filter = self._queue_filter
+        if status_filter is None:
+            return
+        was_shown = old_status == status_filter
+        shown = video_info.status == status_filter
+        if was_shown and not shown:
+            self.queue_tree.detach(video_info.tree_item_id)
+        elif shown and not was_shown:
+            # Put it back in queue order among the rows still showing
+            index = 0
+            for other in self.download_queue:
+                if other is video_info:
+                    break
+                if other.tree_item_id and other.counted_status == status_filter:
+                    index += 1
+            self.queue_tree.move(video_info.tree_item_id, '', index)
+
+    def count_status(self, video_info: VideoInfo):
+        """Move an item's tally to its current status (UI thread only)"""
+        old_status = video_info.counted_status
+        if old_status != video_info.status:
+            if old_status is not None:
+                self._status_counts[old_status] -= 1
+            self._status_counts[video_info.status] += 1
+            video_info.counted_status = video_info.status
+
+    def uncount_status(self, video_info: VideoInfo):
+        """Drop a removed item from the status tallies (UI thread only)"""
+        if video_info.counted_status is not None:
+            self._status_counts[video_info.counted_status] -= 1
+            video_info.counted_status = None
+
     def update_queue_stats(self):
         """Update queue statistics display"""
         total = len(self.download_queue)
-        pending = sum(1 for item in self.download_queue if item.status == "Pending")
-        downloading = sum(1 for item in self.download_queue if item.status == "Downloading")
-        completed = sum(1 for item in self.download_queue if item.status == "Completed")
-        failed = sum(1 for item in self.download_queue if item.status == "Failed")
+        pending = self._status_counts["Pending"]
+        downloading = self._status_counts["Downloading"]
+        completed = self._status_counts["Completed"]
+        failed = self._status_counts["Failed"]
 
         stats_text = f"📊 {total} videos • ⏳ {pending} pending • ⬇️ {downloading} downloading • ✅ {completed} completed"
         if failed > 0:
             stats_text += f" • ❌ {failed} failed"
 
-        self.queue_stats_label.config(text=stats_text)
+        # Progress ticks call this ten times a second while the counts
+        # mostly stand still; only push text that actually changed to Tk
+        if stats_text != self._queue_stats_text:
+            self._queue_stats_text = stats_text
+            self.queue_stats_label.config(text=stats_text)
 
     def paste_urls(self):
         """Paste URLs from clipboard"""
         try:
             clipboard = self.root.clipboard_get()
-            if not self.url_entry.get().strip() or self.url_entry.get() == "Paste YouTube URL here (video, playlist, or channel)":
+            if not self.url_entry.get().strip() or self.url_entry.get() == _URL_ENTRY_PLACEHOLDER:
                 self.url_entry.delete(0, tk.END)
                 self.url_entry.insert(0, clipboard)
-                self.url_entry.configure(foreground='#333333')
+                self.url_entry.configure(style='TEntry')
                 self.validate_url()
             else:
                 self.url_text.delete("1.0", tk.END)
                 self.url_text.insert("1.0", clipboard)
-                self.url_text.configure(foreground='#333333')
         except Exception:
             pass
 
     def clear_inputs(self):
         """Clear all input fields with placeholder restoration"""
         self.url_entry.delete(0, tk.END)
-        self.url_entry.insert(0, "Paste YouTube URL here (video, playlist, or channel)")
-        self.url_entry.configure(foreground='#999999')
+        self.url_entry.insert(0, _URL_ENTRY_PLACEHOLDER)
+        self.url_entry.configure(style='Placeholder.TEntry')
 
         self.url_text.delete("1.0", tk.END)
-        self.url_text.insert("1.0", "Enter multiple YouTube URLs (one per line)")
-        self.url_text.configure(foreground='#999999')
+        self.url_text.insert("1.0", _URL_TEXT_PLACEHOLDER, 'placeholder')
 
         self.validation_label.config(text="")
-        try:
-            self.url_entry.config(style='TEntry')
-        except:
-            pass
 
     def get_urls_from_inputs(self) -> List[str]:
         """Get URLs from input fields"""
         urls = []
+        # A set for the duplicate check; pasted playlists can run to
+        # hundreds of lines and a list membership test makes that quadratic
+        seen = set()
 
         # Single URL entry
         single_url = self.url_entry.get().strip()
-        if single_url and single_url != "Paste YouTube URL here (video, playlist, or channel)":
+        if single_url and single_url != _URL_ENTRY_PLACEHOLDER:
             urls.append(single_url)
-
-        # Multiple URLs text
-        multi_text = self.url_text.get("1.0", tk.END).strip()
-        if multi_text and multi_text != "Enter multiple YouTube URLs (one per line)":
-            for line in multi_text.split('\n'):
-                url = line.strip()
-                if url and url not in urls:
+            seen.add(single_url)
+
+        # Multiple URLs text -- pull each whitespace-separated token out in
+        # one regex pass instead of splitting into lines and stripping each
+        multi_text = self.url_text.get("1.0", "end-1c")
+        if multi_text != _URL_TEXT_PLACEHOLDER:
+            for match in _URL_TOKEN_RE.finditer(multi_text):
+                url = match.group()
+                if url not in seen:
+                    seen.add(url)
                     urls.append(url)
 
         return urls
@@ -1108,142 +1672,268 @@ class YouTubeDownloaderGUI:
 
     def load_and_add_urls(self, urls):
         """Load video/playlist info and add to queue with better URL handling"""
-
-        def worker():
-            try:
-                total_added = 0
-                total_duplicates = 0
-
-                for url in urls:
-                    # Clean and validate URL
-                    clean_url = self.clean_youtube_url(url)
-                    if not clean_url:
-                        self.message_queue.put(("error", f"Invalid URL: {url}"))
+        # Everything that reads Tk variables is resolved here on the UI
+        # thread; the loader itself runs on the background download loop.
+        ydl_opts = {
+            'quiet': True,
+            'no_warnings': True,
+            # Playlist entries come back as the light records on the
+            # playlist page itself, one fetch for the whole list instead of
+            # a full lookup per video. The download resolves each video
+            # properly anyway. Single videos are still looked up in full.
+            'extract_flat': 'in_playlist',
+            'socket_timeout': 30,
+            'no_check_certificate': True,
+            'ignore_errors': False,
+            **self._yt_dlp_shared_opts(),
+        }
+        workers = max(1, self.max_concurrent.get())
+        with self._progress_lock:
+            self._loads_running += 1
+        future = asyncio.run_coroutine_threadsafe(self.load_urls(urls, ydl_opts, workers),
+                                                  self.get_download_loop())
+        future.add_done_callback(self._load_finished)
+        self.poll_soon()
+
+    def _load_finished(self, future):
+        """Done callback for a metadata load (runs on the loop thread)"""
+        with self._progress_lock:
+            self._loads_running -= 1
+
+    async def load_urls(self, urls, ydl_opts, workers):
+        """Fetch info for every URL concurrently, then queue the results.
+
+        Each lookup is one or more round trips to YouTube, so a paste of
+        N URLs used to take N round trips end to end. Up to `workers`
+        lookups now run at once on the info executor. Each one borrows a
+        YoutubeDL from a small pool -- an instance isn't safe to share
+        between threads, but building one per URL means setting up the
+        extractors (and reading browser cookies) every time.
+        """
+        ydl_pool = asyncio.Queue()
+        try:
+            import yt_dlp
+
+            loop = asyncio.get_running_loop()
+            total_added = 0
+            total_duplicates = 0
+
+            # Plain video links name their video ID, so a link to something
+            # already queued -- or pasted twice in different shapes, e.g.
+            # youtu.be/ID and watch?v=ID -- is caught here from the ID,
+            # without spending a network lookup to find out.
+            pasted_videos = set()
+            cleaned = []
+            for url in urls:
+                # Clean and validate URL
+                clean_url = self.clean_youtube_url(url)
+                if not clean_url:
+                    self.post_message("error", f"Invalid URL: {url}")
+                    continue
+                video_url = canonical_video_url(clean_url)
+                video_id = None
+                if video_url:
+                    if video_url in self._queue_urls or video_url in pasted_videos:
+                        total_duplicates += 1
                         continue
+                    pasted_videos.add(video_url)
+                    video_id = video_url.rpartition('=')[2]
+                cleaned.append((url, clean_url, video_id))
+
+            # Videos looked up recently come straight from the on-disk cache
+            cached = await loop.run_in_executor(
+                self._info_executor, self._meta_cache.get_many,
+                [video_id for _, _, video_id in cleaned if video_id])
+            misses = sum(1 for _, _, video_id in cleaned if video_id not in cached)
+
+            for _ in range(min(workers, misses)):
+                ydl_pool.put_nowait(yt_dlp.YoutubeDL(ydl_opts))
+
+            async def fetch(url, clean_url, video_id):
+                if video_id in cached:
+                    return url, clean_url, cached[video_id], None
+                ydl = await ydl_pool.get()
+                try:
+                    self.post_message("status", f"Loading: {clean_url}")
+                    # YouTube answers a burst of lookups with HTTP 429. Back
+                    # off and retry rather than failing the URL; the worker
+                    # keeps its YoutubeDL while it waits, so the whole batch
+                    # slows down with it.
+                    for delay in (2, 5, None):
+                        try:
+                            info = await loop.run_in_executor(self._info_executor,
+                                                              ydl.extract_info, clean_url, False)
+                            return url, clean_url, info, None
+                        except yt_dlp.DownloadError as e:
+                            if delay is None or '429' not in str(e):
+                                raise
+                            self.post_message("status", f"Rate limited, retrying in {delay}s: {clean_url}")
+                            await asyncio.sleep(delay)
+                except Exception as e:
+                    return url, clean_url, None, e
+                finally:
+                    ydl_pool.put_nowait(ydl)
+
+            results = await asyncio.gather(*(fetch(*item) for item in cleaned))
+
+            # Queue results in paste order. This runs on the loop thread
+            # only, so concurrent batches can't race on the duplicate check.
+            # Every new video's row goes to the UI thread in one message
+            # once the whole paste is processed.
+            fresh = []
+            new_items = []
+            for url, clean_url, info, error in results:
+                if isinstance(error, yt_dlp.DownloadError):
+                    self.post_message("error", f"Video unavailable: {url} - {str(error)}")
+                    continue
+                if error is not None:
+                    self.post_message("error", f"Error loading {url}: {str(error)}")
+                    continue
 
-                    self.message_queue.put(("status", f"Loading: {clean_url}"))
-
-                    try:
-                        # Load video/playlist info with better options
-                        ydl_opts = {
-                            'quiet': True,
-                            'no_warnings': True,
-                            'extract_flat': False,
-                            'socket_timeout': 30,
-                            'no_check_certificate': True,
-                            'ignore_errors': False,
-                            **self._yt_dlp_shared_opts(),
-                        }
-
-                        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                            info = ydl.extract_info(clean_url, download=False)
-
-                        if info:
-                            if 'entries' in info and info['entries']:
-                                # Playlist - add all videos
-                                playlist_title = info.get('title', 'Unknown Playlist')
-                                self.message_queue.put(
-                                    ("status", f"Adding playlist: {playlist_title} ({len(info['entries'])} videos)"))
-
-                                for i, entry in enumerate(info['entries']):
-                                    if entry:
-                                        # Use the original YouTube URL, not the direct stream URL
-                                        video_id = entry.get('id')
-                                        if video_id:
-                                            video_url = f"https://www.youtube.com/watch?v={video_id}"
-                                        else:
-                                            video_url = entry.get('webpage_url', entry.get('url', ''))
-
-                                        if video_url and not any(v.url == video_url for v in self.download_queue):
-                                            video_info = VideoInfo(
-                                                url=video_url,
-                                                title=entry.get('title', f'Video {i + 1}'),
-                                                duration=self.format_duration(entry.get('duration', 0)),
-                                                uploader=entry.get('uploader', info.get('uploader', 'Unknown')),
-                                                view_count=entry.get('view_count', 0),
-                                                status="Pending"
-                                            )
-
-                                            self.download_queue.append(video_info)
-
-                                            # Add to tree
-                                            item_id = self.queue_tree.insert('', 'end', values=(
-                                                "⏳ Pending",
-                                                video_info.title,
-                                                video_info.duration,
-                                                video_info.uploader,
-                                                "0%",
-                                                "",
-                                                "",
-                                                ""
-                                            ))
-                                            video_info.tree_item_id = item_id
-                                            total_added += 1
-                                        else:
-                                            total_duplicates += 1
-                            else:
-                                # Single video - ensure we have the correct URL format
-                                video_id = info.get('id')
-                                if video_id:
-                                    clean_url = f"https://www.youtube.com/watch?v={video_id}"
-
-                                if not any(v.url == clean_url for v in self.download_queue):
-                                    video_info = VideoInfo(
-                                        url=clean_url,
-                                        title=info.get('title', 'Unknown'),
-                                        duration=self.format_duration(info.get('duration', 0)),
-                                        uploader=info.get('uploader', 'Unknown'),
-                                        view_count=info.get('view_count', 0),
-                                        status="Pending"
-                                    )
-
-                                    self.download_queue.append(video_info)
-
-                                    # Add to tree
-                                    item_id = self.queue_tree.insert('', 'end', values=(
-                                        "⏳ Pending",
-                                        video_info.title,
-                                        video_info.duration,
-                                        video_info.uploader,
-                                        "0%",
-                                        "",
-                                        "",
-                                        ""
-                                    ))
-                                    video_info.tree_item_id = item_id
-                                    total_added += 1
-                                else:
-                                    total_duplicates += 1
+                try:
+                    if info:
+                        if 'entries' in info and info['entries']:
+                            # Playlist - add all videos
+                            playlist_title = info.get('title', 'Unknown Playlist')
+                            self.post_message(
+                                "status", f"Adding playlist: {playlist_title} ({len(info['entries'])} videos)")
+
+                            for i, entry in enumerate(info['entries']):
+                                if entry:
+                                    # Use the original YouTube URL, not the direct stream URL
+                                    # Flat entries can carry fields set to None, and
+                                    # name the uploader only as the channel
+                                    uploader = (entry.get('uploader') or entry.get('channel')
+                                                or info.get('uploader') or 'Unknown')
+                                    video_id = entry.get('id')
+                                    if video_id:
+                                        video_url = f"https://www.youtube.com/watch?v={video_id}"
+                                        # Only complete records are worth caching for
+                                        # a later single-video add
+                                        if entry.get('title') and entry.get('duration'):
+                                            fresh.append({**entry, 'uploader': uploader})
+                                    else:
+                                        video_url = entry.get('webpage_url', entry.get('url', ''))
+
+                                    if video_url and video_url not in self._queue_urls:
+                                        video_info = VideoInfo(
+                                            url=video_url,
+                                            title=entry.get('title') or f'Video {i + 1}',
+                                            duration=_format_duration(int(entry.get('duration') or 0)),
+                                            uploader=uploader,
+                                            view_count=entry.get('view_count') or 0,
+                                            status="Pending"
+                                        )
+
+                                        self._queue_urls.add(video_url)
+                                        new_items.append(video_info)
+                                        total_added += 1
+                                    else:
+                                        total_duplicates += 1
                         else:
-                            self.message_queue.put(("error", f"Failed to load: {url}"))
+                            # Single video - ensure we have the correct URL format
+                            video_id = info.get('id')
+                            if video_id:
+                                clean_url = f"https://www.youtube.com/watch?v={video_id}"
+                                if video_id not in cached:
+                                    fresh.append(info)
+
+                            if clean_url not in self._queue_urls:
+                                video_info = VideoInfo(
+                                    url=clean_url,
+                                    title=info.get('title', 'Unknown'),
+                                    duration=_format_duration(int(info.get('duration') or 0)),
+                                    uploader=info.get('uploader', 'Unknown'),
+                                    view_count=info.get('view_count', 0),
+                                    status="Pending"
+                                )
+
+                                self._queue_urls.add(clean_url)
+                                new_items.append(video_info)
+                                total_added += 1
+                            else:
+                                total_duplicates += 1
+                    else:
+                        self.post_message("error", f"Failed to load: {url}")
 
-                    except yt_dlp.DownloadError as e:
-                        self.message_queue.put(("error", f"Video unavailable: {url} - {str(e)}"))
-                    except Exception as e:
-                        self.message_queue.put(("error", f"Error loading {url}: {str(e)}"))
+                except Exception as e:
+                    self.post_message("error", f"Error loading {url}: {str(e)}")
 
-                # Final status update
-                status_msg = f"✅ Added {total_added} video(s) to queue"
-                if total_duplicates > 0:
-                    status_msg += f" ({total_duplicates} duplicate(s) skipped)"
+            # Tk isn't thread-safe, and Start reads download_queue on the UI
+            # thread, so the videos join the queue there along with their
+            # rows. Their URLs are already in _queue_urls, which keeps a
+            # second paste from loading them again in the meantime.
+            if new_items:
+                self.post_message("add_rows", new_items)
 
-                self.message_queue.put(("status", status_msg))
-                self.message_queue.put(("update_stats", None))
+            if fresh:
+                await loop.run_in_executor(self._info_executor, self._meta_cache.put_many, fresh)
 
-                # Log activity
-                self.message_queue.put(("log_activity", f"➕ Added {total_added} video(s) to queue"))
+            # Final status update
+            status_msg = f"✅ Added {total_added} video(s) to queue"
+            if total_duplicates > 0:
+                status_msg += f" ({total_duplicates} duplicate(s) skipped)"
 
-            except Exception as e:
-                self.message_queue.put(("error", f"Error adding to queue: {str(e)}"))
+            self.post_message("status", status_msg)
+            self.post_message("update_stats")
 
-        # Start worker thread
-        threading.Thread(target=worker, daemon=True).start()
+            # Log activity
+            self.post_message("log_activity", f"➕ Added {total_added} video(s) to queue")
+
+        except Exception as e:
+            self.post_message("error", f"Error adding to queue: {str(e)}")
+        finally:
+            while not ydl_pool.empty():
+                ydl_pool.get_nowait().close()
+
+    def insert_queue_rows(self, items: List[VideoInfo], start: int = 0,
+                          generation: Optional[int] = None):
+        """Add rows for newly queued videos, a chunk at a time (UI thread only)"""
+        if generation is None:
+            generation = self._queue_generation
+        elif generation != self._queue_generation:
+            return  # The queue was cleared since this paste started going in
+
+        end = start + 50
+        for video_info in items[start:end]:
+            self.insert_queue_row(video_info)
+
+        if end < len(items):
+            # Let the window repaint and handle input between chunks, so a
+            # long playlist doesn't freeze it while its rows go in
+            self.root.after_idle(self.insert_queue_rows, items, end, generation)
+        else:
+            self.update_queue_stats()
+
+    def insert_queue_row(self, video_info: VideoInfo):
+        """Queue a loaded video and add its row to the tree (UI thread only)"""
+        self.download_queue.append(video_info)
+        # Usually reserved already by load_urls, but not if a Clear All
+        # emptied the set while this video was still loading
+        self._queue_urls.add(video_info.url)
+        values = (
+            "⏳ Pending",
+            video_info.title,
+            video_info.duration,
+            video_info.uploader,
+            "0%",
+            "",
+            "",
+            ""
+        )
+        video_info.tree_item_id = self.queue_tree.insert('', 'end', values=values)
+        video_info.shown_values = values
+        self._items_by_tree_id[video_info.tree_item_id] = video_info
+        if self._queue_filter is not None and video_info.status != self._queue_filter:
+            self.queue_tree.detach(video_info.tree_item_id)
+        self.count_status(video_info)
+        self.feed_running_download(video_info)
 
     def is_valid_youtube_url(self, url):
         """Check if URL is a valid YouTube URL format"""
         if not url:
             return False
-        return any(re.match(pattern, url) for pattern in self.youtube_patterns)
+        return _YOUTUBE_URL_RE.match(url) is not None
 
     def clean_youtube_url(self, url):
         """Clean and normalize YouTube URLs"""
@@ -1252,34 +1942,29 @@ class YouTubeDownloaderGUI:
 
         url = url.strip()
 
+        # Reject anything not actually hosted on YouTube before running the
+        # patterns below -- they're unanchored, so a link like
+        # https://example.com/?u=youtube.com/watch?v=... would slip through.
+        try:
+            host = urlsplit(url if '://' in url else 'https://' + url).hostname
+        except ValueError:  # Malformed, e.g. an unclosed [IPv6] bracket
+            return None
+        if host not in _YT_HOSTS:
+            return None
+
         # If it's already a proper YouTube URL, return as-is
-        if any(re.match(pattern, url) for pattern in self.youtube_patterns):
+        if _YOUTUBE_URL_RE.match(url):
             return url
 
         # Extract video ID from various YouTube URL formats
-        video_id_patterns = [
-            r'(?:youtube\.com/watch\?v=|youtu\.be/)([a-zA-Z0-9_-]{11})',
-            r'youtube\.com/embed/([a-zA-Z0-9_-]{11})',
-            r'youtube\.com/v/([a-zA-Z0-9_-]{11})',
-        ]
-
-        for pattern in video_id_patterns:
-            match = re.search(pattern, url)
-            if match:
-                video_id = match.group(1)
-                return f"https://www.youtube.com/watch?v={video_id}"
+        match = _VIDEO_ID_RE.search(url)
+        if match:
+            return f"https://www.youtube.com/watch?v={match.group(1)}"
 
         # Check if it's a playlist URL
-        playlist_patterns = [
-            r'youtube\.com/playlist\?list=([a-zA-Z0-9_-]+)',
-            r'youtube\.com/watch\?.*list=([a-zA-Z0-9_-]+)',
-        ]
-
-        for pattern in playlist_patterns:
-            match = re.search(pattern, url)
-            if match:
-                playlist_id = match.group(1)
-                return f"https://www.youtube.com/playlist?list={playlist_id}"
+        match = _PLAYLIST_RE.search(url)
+        if match:
+            return f"https://www.youtube.com/playlist?list={match.group(1)}"
 
         # If we can't clean it, return None
         return None
@@ -1289,6 +1974,13 @@ class YouTubeDownloaderGUI:
         if self.is_downloading:
             messagebox.showinfo("Already Downloading", "Downloads are already in progress")
             return
+        if self._batch_future is not None and not self._batch_future.done():
+            # A new Start would clear _cancel_event and revive the stopped
+            # batch's transfers, and that batch's cleanup would then reset
+            # is_downloading under the new one
+            messagebox.showinfo("Stopping", "The previous downloads are still stopping. "
+                                            "Try again in a moment.")
+            return
 
         pending_items = [item for item in self.download_queue if item.status == "Pending"]
         if not pending_items:
@@ -1297,301 +1989,403 @@ class YouTubeDownloaderGUI:
 
         # Update UI
         self.is_downloading = True
+        self._cancel_event.clear()
         self.download_button.config(state=tk.DISABLED)
         self.pause_button.config(state=tk.NORMAL)
         self.stop_button.config(state=tk.NORMAL)
 
-        # Start download thread
-        download_thread = threading.Thread(target=self.download_worker, daemon=True)
-        download_thread.start()
-
-    def download_worker(self):
-        """Worker thread for downloads"""
+        # Hand the batch to the long-lived download loop
+        download_path = Path(self.download_dir.get())
+        workers = max(1, self.max_concurrent.get())
+        ydl_opts = self.download_opts(download_path)
+        future = asyncio.run_coroutine_threadsafe(
+            self.download_worker(pending_items, download_path, workers, ydl_opts),
+            self.get_download_loop())
+        future.add_done_callback(lambda f: self.post_message("download_complete"))
+        self._batch_future = future
+        self.poll_soon()
+
+    def shutdown(self):
+        """Release the background workers when the window closes"""
+        self.flush_settings()
+        # Let the last save land. Safe to block on: write_settings only
+        # touches the disk and the message queue, never Tk.
+        self._settings_executor.shutdown(wait=True)
+        self._analytics_write_q.put(False)  # Final write, then the writer exits
+        self._analytics_thread.join(timeout=2)
+        self._info_executor.shutdown(wait=False, cancel_futures=True)
+        self._cancel_event.set()  # Abort any transfer still running
+        self._download_executor.shutdown(wait=False, cancel_futures=True)
+        self._meta_cache.close()
+        if self._event_loop is not None:
+            self._event_loop.call_soon_threadsafe(self._event_loop.stop)
+
+    def get_download_loop(self):
+        """Return the background event loop that runs every download batch.
+
+        Started on first use and kept for the life of the window, so each
+        Start press reuses the same loop instead of building and tearing
+        down a fresh one (plus its worker thread) per batch.
+        """
+        if self._event_loop is None:
+            self._event_loop = asyncio.new_event_loop()
+            threading.Thread(target=self._event_loop.run_forever, daemon=True).start()
+        return self._event_loop
+
+    async def download_worker(self, pending_items, download_path, workers, ydl_opts):
+        """Run one download batch on the background loop.
+
+        The batch is snapshotted by start_download on the UI thread, the
+        only thread that adds to download_queue, so a video queued after
+        that is handed over once through feed_running_download and never
+        also picked up here.
+        """
         try:
             # Create download directory
-            download_path = Path(self.download_dir.get())
             download_path.mkdir(parents=True, exist_ok=True)
 
-            pending_items = [item for item in self.download_queue if item.status == "Pending"]
             total_items = len(pending_items)
 
             if total_items == 0:
-                self.message_queue.put(("status", "No pending items to download"))
+                self.post_message("status", "No pending items to download")
                 return
 
-            self.message_queue.put(("status", f"Starting download of {total_items} items..."))
+            self.post_message("status", f"Starting download of {total_items} items...")
 
-            # Run the async download function
-            asyncio.run(self.async_download_worker(pending_items, download_path, total_items))
+            await self.async_download_worker(pending_items, download_path, total_items, workers,
+                                             ydl_opts)
 
         except Exception as e:
-            self.message_queue.put(("error", f"Unexpected download error: {str(e)}"))
+            self.post_message("error", f"Unexpected download error: {str(e)}")
         finally:
+            # Still this batch's flag: start_download refuses to begin
+            # another until this coroutine's future is done
             self.is_downloading = False
-            self.message_queue.put(("download_complete", None))
 
-    async def async_download_worker(self, pending_items, download_path, total_items):
-        """Async download worker with proper progress tracking"""
+    async def async_download_worker(self, pending_items, download_path, total_items, workers,
+                                    ydl_opts):
+        """Async download worker with proper progress tracking.
+
+        `workers` is the Max Concurrent setting and `ydl_opts` the yt-dlp
+        options, both read by start_download on the UI thread since Tk
+        variables mustn't be touched from here.
+        """
         try:
             successful_downloads = 0
             failed_downloads = 0
+            cancelled_downloads = 0
+            finished = 0
+
+            # Each download spends nearly all of its time waiting on the
+            # network inside yt-dlp, so a fixed pool of max_concurrent
+            # consumers pulls from one queue and overlaps them. Videos the
+            # user adds while the batch is running are fed into the same
+            # queue (see feed_running_download) and start as soon as a
+            # consumer frees up, instead of waiting for the next batch.
+            work_queue = asyncio.Queue()
+            for item in pending_items:
+                work_queue.put_nowait(item)
+            self._download_total = total_items
+            self._download_queue_aio = work_queue
+            self._download_loop = asyncio.get_running_loop()
+
+            async def consumer():
+                nonlocal successful_downloads, failed_downloads, cancelled_downloads, finished
+                while True:
+                    item = await work_queue.get()
+                    try:
+                        if item is None:
+                            return
+                        if not self.is_downloading or item.status != "Pending":
+                            continue
 
-            # Download each item
-            for i, item in enumerate(pending_items):
-                if not self.is_downloading:
-                    self.message_queue.put(("status", "Download cancelled by user"))
-                    break
+                        with self._progress_lock:
+                            self._active_downloads.add(item)
+                        try:
+                            succeeded = await self.download_item(item, download_path, ydl_opts)
+                        finally:
+                            with self._progress_lock:
+                                self._active_downloads.discard(item)
+
+                        if succeeded:
+                            successful_downloads += 1
+                        elif item.status == "Pending":
+                            # Stop aborted it mid-transfer; download_item put
+                            # it back in the queue and recorded nothing
+                            cancelled_downloads += 1
+                            self.post_progress("video_status", item)
+                            continue
+                        else:
+                            failed_downloads += 1
 
-                try:
-                    # Update item status
-                    item.status = "Downloading"
-                    self.progress_queue.put(("video_status", item))
-                    self.message_queue.put(("status", f"Downloading: {item.title[:50]}..."))
-
-                    # Debug: Log the URL being downloaded
-                    print(f"DEBUG: Attempting to download URL: {item.url}")
-
-                    # Validate URL format before downloading
-                    if not self.is_valid_youtube_url(item.url):
-                        item.status = "Failed"
-                        item.error = f"Invalid YouTube URL format: {item.url}"
-                        self.progress_queue.put(("video_status", item))
-                        failed_downloads += 1
-                        continue
+                        # Update overall progress
+                        finished += 1
+                        overall_progress = (finished / self._download_total) * 100
+                        self.post_progress("overall_progress", overall_progress)
+                        self.post_progress("video_status", item)
+                    finally:
+                        work_queue.task_done()
 
-                    # Create progress callback for this specific item
-                    def progress_callback(d):
-                        if d['status'] == 'downloading':
-                            try:
-                                downloaded = d.get('downloaded_bytes', 0)
-                                total = d.get('total_bytes') or d.get('total_bytes_estimate', 0)
-
-                                if total > 0:
-                                    progress = (downloaded / total) * 100
-                                    item.progress = min(int(progress), 100)
-
-                                    # Format speed
-                                    speed = d.get('speed', 0)
-                                    if speed:
-                                        if speed > 1024 * 1024:
-                                            item.speed = f"{speed / (1024 * 1024):.1f} MB/s"
-                                        elif speed > 1024:
-                                            item.speed = f"{speed / 1024:.1f} KB/s"
-                                        else:
-                                            item.speed = f"{speed:.0f} B/s"
-
-                                    # Format ETA
-                                    eta = d.get('eta')
-                                    if eta:
-                                        if eta > 3600:
-                                            item.eta = f"{eta // 3600:02d}:{(eta % 3600) // 60:02d}:{eta % 60:02d}"
-                                        else:
-                                            item.eta = f"{eta // 60:02d}:{eta % 60:02d}"
-
-                                    # Format size
-                                    if total:
-                                        if total > 1024 * 1024 * 1024:
-                                            item.size = f"{total / (1024 * 1024 * 1024):.1f} GB"
-                                        elif total > 1024 * 1024:
-                                            item.size = f"{total / (1024 * 1024):.1f} MB"
-                                        else:
-                                            item.size = f"{total / 1024:.1f} KB"
-
-                                    # Update current progress bar
-                                    self.progress_queue.put(("current_progress", item.progress))
-                                    self.progress_queue.put(("video_status", item))
-
-                            except Exception as e:
-                                pass  # Don't let progress errors stop downloads
-
-                    # Use download method with progress tracking
-                    success, message = await self.simple_download_fallback(item.url, download_path,
-                                                                           progress_callback)
-
-                    # If that fails, try the most basic approach
-                    if not success:
-                        self.message_queue.put(("status", f"Trying basic download method..."))
-                        success, message = await self.basic_download_fallback(item.url, download_path)
-
-                    if success:
-                        item.status = "Completed"
-                        item.progress = 100
-                        item.speed = ""
-                        item.eta = ""
-                        successful_downloads += 1
-
-                        # Calculate file size for analytics
-                        file_size_mb = 0.0
-
-                        # Try to find the downloaded file and get its size
-                        try:
-                            # Look for the file in the download directory
-                            for file_path in download_path.glob("*"):
-                                if file_path.is_file() and any(ext in file_path.suffix.lower()
-                                                               for ext in ['.mp4', '.webm', '.mkv', '.mp3', '.m4a']):
-                                    # Check if file was modified recently (within last 2 minutes)
-                                    if (datetime.now().timestamp() - file_path.stat().st_mtime) < 120:
-                                        item.file_path = str(file_path)
-                                        file_size_mb = self.get_file_size_mb(str(file_path))
-                                        break
-                        except Exception:
-                            pass
-
-                        # If we couldn't find the file, estimate from progress data
-                        if file_size_mb == 0.0:
-                            file_size_mb = self.estimate_file_size_from_progress(item)
-
-                        # Record successful download
-                        self.record_download(item, True, file_size_mb)
+            consumers = [asyncio.create_task(consumer()) for _ in range(workers)]
+            try:
+                await work_queue.join()
+            finally:
+                # Stop accepting new items, then release every consumer
+                self._download_loop = None
+                self._download_queue_aio = None
+                for _ in consumers:
+                    work_queue.put_nowait(None)
+                await asyncio.gather(*consumers)
 
-                    else:
-                        item.status = "Failed"
-                        item.error = message
-                        item.progress = 0
-                        item.speed = ""
-                        item.eta = ""
-                        failed_downloads += 1
+            # Final status
+            if self.is_downloading:  # Only show completion message if not cancelled
+                self.post_message("status",
+                                  f"Download complete! ✓ {successful_downloads} successful, "
+                                  f"✗ {failed_downloads} failed")
+            else:
+                self.post_message("status",
+                                  f"Download cancelled by user. ✓ {successful_downloads} successful, "
+                                  f"✗ {failed_downloads} failed, {cancelled_downloads} stopped")
 
-                        # Record failed download
-                        self.record_download(item, False, 0.0)
+        except Exception as e:
+            self.post_message("error", f"Download setup error: {str(e)}")
 
-                except Exception as e:
-                    item.status = "Failed"
-                    item.error = f"Download error: {str(e)}"
-                    item.progress = 0
-                    failed_downloads += 1
+    def feed_running_download(self, video_info: VideoInfo):
+        """Hand a newly queued video to the running download batch, if any"""
+        loop = self._download_loop
+        if loop is None or not self.is_downloading:
+            return
+        try:
+            loop.call_soon_threadsafe(self._enqueue_running_download, video_info)
+        except RuntimeError:
+            pass  # Loop closed between the check and the call
 
-                    # Record failed download
-                    self.record_download(item, False, 0.0)
+    def _enqueue_running_download(self, video_info: VideoInfo):
+        """Runs on the download loop; queues a video added mid-batch"""
+        if self._download_queue_aio is None:
+            return  # Batch already wound down; the item stays Pending
+        self._download_total += 1
+        self._download_queue_aio.put_nowait(video_info)
 
-                # Update overall progress
-                overall_progress = ((i + 1) / total_items) * 100
-                self.progress_queue.put(("overall_progress", overall_progress))
-                self.progress_queue.put(("video_status", item))
+    async def download_item(self, item, download_path, ydl_opts):
+        """Download a single queued item and record the outcome.
 
-                # Reset current progress for next video
-                self.progress_queue.put(("current_progress", 0))
+        Returns True if the video was downloaded.
+        """
+        try:
+            # Update item status
+            item.status = "Downloading"
+            self.post_progress("video_status", item)
+            self.post_message("status", f"Downloading: {item.title[:50]}...")
+
+            # Validate URL format before downloading
+            if not self.is_valid_youtube_url(item.url):
+                item.status = "Failed"
+                item.error = f"Invalid YouTube URL format: {item.url}"
+                self.post_progress("video_status", item)
+                return False
+
+            # Use download method with progress tracking
+            success, message, file_path = await self.simple_download_fallback(
+                item.url, ydl_opts, partial(self._progress_callback, item))
+
+            # Stopped mid-transfer: put it back in the queue for next time
+            # rather than counting it as a failure
+            if not success and self._cancel_event.is_set():
+                item.status = "Pending"
+                item.progress = 0
+                item.speed = ""
+                item.eta = ""
+                return False
+
+            if success:
+                item.status = "Completed"
+                item.progress = 100
+                item.speed = ""
+                item.eta = ""
+
+                # Calculate file size for analytics. yt-dlp reports where it
+                # wrote the file, so that's a single stat.
+                item.file_path = file_path or ""
+                file_size_mb = self.get_file_size_mb(file_path)
+
+                # Only scan the folder if yt-dlp didn't say or the file has
+                # since moved
+                if file_size_mb == 0.0:
+                    # scandir's entries carry the directory listing's own
+                    # stat data on Windows, so this costs one walk instead
+                    # of a Path plus a separate stat call per file
+                    cutoff = time.time() - 120  # Modified in the last 2 minutes
+                    try:
+                        with os.scandir(download_path) as entries:
+                            for entry in entries:
+                                if not entry.name.lower().endswith(_VIDEO_EXTENSIONS):
+                                    continue
+                                if not entry.is_file():
+                                    continue
+                                stat = entry.stat()
+                                if stat.st_mtime > cutoff:
+                                    item.file_path = entry.path
+                                    file_size_mb = stat.st_size / _MB
+                                    break
+                    except OSError:
+                        pass
+
+                # If we couldn't find the file, estimate from progress data
+                if file_size_mb == 0.0:
+                    file_size_mb = self.estimate_file_size_from_progress(item)
+
+                # Record successful download
+                self.record_download(item, True, file_size_mb)
+                return True
 
-                # Small delay to prevent overwhelming the UI
-                await asyncio.sleep(0.1)
+            else:
+                item.status = "Failed"
+                item.error = message
+                item.progress = 0
+                item.speed = ""
+                item.eta = ""
 
-            # Final status
-            if self.is_downloading:  # Only show completion message if not cancelled
-                self.message_queue.put(("status",
-                                        f"Download complete! ✓ {successful_downloads} successful, "
-                                        f"✗ {failed_downloads} failed"))
+                # Record failed download
+                self.record_download(item, False, 0.0)
+                return False
 
         except Exception as e:
-            self.message_queue.put(("error", f"Download setup error: {str(e)}"))
+            item.status = "Failed"
+            item.error = f"Download error: {str(e)}"
+            item.progress = 0
 
-    async def simple_download_fallback(self, url, download_path, progress_callback=None):
-        """Enhanced download with multiple format fallbacks"""
-        try:
-            import concurrent.futures
+            # Record failed download
+            self.record_download(item, False, 0.0)
+            return False
+
+    def _progress_callback(self, item: VideoInfo, d: Dict):
+        """yt-dlp progress hook for one item (runs on the download thread).
+
+        A bound method handed over with functools.partial, rather than a
+        closure defined afresh for every download.
+        """
+        if d['status'] == 'downloading':
+            try:
+                downloaded = d.get('downloaded_bytes', 0)
+                total = d.get('total_bytes') or d.get('total_bytes_estimate', 0)
+
+                if total > 0:
+                    progress = (downloaded / total) * 100
+
+                    # yt-dlp calls this for every block it writes, hundreds
+                    # of times a second on a fast link. Post at most one
+                    # update per 250 ms unless the bar moved a whole percent,
+                    # and skip the formatting below for the ticks in between.
+                    now = time.monotonic()
+                    if (now - item.last_emit_ts < 0.25
+                            and abs(progress - item.last_emit_pct) < 1.0):
+                        return
+                    item.last_emit_ts = now
+                    item.last_emit_pct = progress
+
+                    item.progress = min(int(progress), 100)
+
+                    # Format speed
+                    speed = d.get('speed', 0)
+                    if speed:
+                        if speed > _MB:
+                            item.speed = _format_rate(round(speed * 10 / _MB), "MB/s")
+                        elif speed > _KB:
+                            item.speed = _format_rate(round(speed * 10 / _KB), "KB/s")
+                        else:
+                            item.speed = f"{speed:.0f} B/s"
+
+                    # Format ETA
+                    eta = d.get('eta')
+                    if eta:
+                        item.eta = _format_eta(int(eta))
+
+                    # Format size
+                    if total:
+                        item.size = _format_size(int(total))
+
+                    # The active-downloads bar is worked out from every
+                    # running item on the UI side; only the row is posted
+                    self.post_progress("video_status", item)
+
+            except Exception as e:
+                pass  # Don't let progress errors stop downloads
+
+    def download_opts(self, download_path: Path) -> Dict:
+        """yt-dlp options for a download batch (UI thread only).
 
+        Reads the quality, subtitle and cookie settings here, since the
+        download threads must never touch Tk variables. Each download adds
+        its own progress hook on top.
+        """
+        # yt-dlp takes "a/b/c" as an ordered fallback and walks it against
+        # the one format list it fetched, so a single YoutubeDL and a single
+        # extraction cover the whole chain instead of a fresh instance (and
+        # page fetch) per selector.
+        formats_to_try = _FORMAT_CHAINS.get(self.video_quality.get(), _FORMAT_CHAINS["best"])
+        return {
+            'outtmpl': str(download_path / '%(title)s.%(ext)s'),
+            'format': "/".join(formats_to_try),
+            'quiet': True,
+            'no_warnings': True,
+            'extractaudio': False,
+            'writesubtitles': self.save_descriptions.get(),
+            'writeautomaticsub': False,
+            'ignoreerrors': False,
+            'retries': 2,
+            'fragment_retries': 2,
+            'socket_timeout': 30,
+            'no_check_certificate': True,
+            **self._yt_dlp_shared_opts(),
+        }
+
+    async def simple_download_fallback(self, url, ydl_opts, progress_callback=None):
+        """Enhanced download with multiple format fallbacks.
+
+        `ydl_opts` comes from download_opts, built on the UI thread.
+        """
+        try:
             def download_sync():
-                # Progress hook that calls our callback
+                import yt_dlp
+
+                # Progress hook that calls our callback. yt-dlp calls it for
+                # every chunk it writes, which makes it the place to notice
+                # Stop: raising DownloadCancelled here aborts the transfer
+                # mid-file instead of letting the current video finish.
                 def progress_hook(d):
+                    if self._cancel_event.is_set():
+                        raise yt_dlp.utils.DownloadCancelled()
                     if progress_callback:
                         progress_callback(d)
 
-                # Try multiple format selectors in order of preference
-                quality_setting = self.video_quality.get()
-
-                # Define format fallback chain
-                format_chains = {
-                    "best": [
-                        "best[height<=1080][ext=mp4]",
-                        "best[height<=1080]",
-                        "best[ext=mp4]",
-                        "best"
-                    ],
-                    "best[height<=1080p]": [
-                        "best[height<=1080][ext=mp4]",
-                        "best[height<=1080]",
-                        "best[ext=mp4]",
-                        "best"
-                    ],
-                    "best[height<=720p]": [
-                        "best[height<=720][ext=mp4]",
-                        "best[height<=720]",
-                        "best[height<=1080][ext=mp4]",
-                        "best[ext=mp4]",
-                        "best"
-                    ],
-                    "best[height<=480p]": [
-                        "best[height<=480][ext=mp4]",
-                        "best[height<=480]",
-                        "best[height<=720][ext=mp4]",
-                        "best[ext=mp4]",
-                        "best"
-                    ],
-                    "best[height<=360p]": [
-                        "best[height<=360][ext=mp4]",
-                        "best[height<=360]",
-                        "best[height<=480][ext=mp4]",
-                        "best[ext=mp4]",
-                        "best"
-                    ],
-                    "worst": [
-                        "worst[ext=mp4]",
-                        "worst"
-                    ]
-                }
-
-                formats_to_try = format_chains.get(quality_setting, format_chains["best"])
-
-                # Try each format in the chain
-                for format_selector in formats_to_try:
-                    try:
-                        ydl_opts = {
-                            'outtmpl': str(download_path / '%(title)s.%(ext)s'),
-                            'format': format_selector,
-                            'quiet': True,
-                            'no_warnings': True,
-                            'extractaudio': False,
-                            'writesubtitles': self.save_descriptions.get(),
-                            'writeautomaticsub': False,
-                            'ignoreerrors': False,
-                            'retries': 2,
-                            'fragment_retries': 2,
-                            'socket_timeout': 30,
-                            'progress_hooks': [progress_hook] if progress_callback else [],
-                            'no_check_certificate': True,
-                            **self._yt_dlp_shared_opts(),
-                        }
-
-                        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                            result = ydl.download([url])
-                            if result == 0:
-                                return True, f"Downloaded successfully using format: {format_selector}"
-
-                    except yt_dlp.DownloadError as e:
-                        # If this format failed, try the next one
-                        if "Requested format is not available" in str(e):
-                            continue
-                        else:
-                            # Different error, might be worth reporting
-                            if format_selector == formats_to_try[-1]:  # Last format
-                                return False, f"yt-dlp error: {str(e)}"
-                            continue
-                    except Exception as e:
-                        # Other errors, try next format
-                        if format_selector == formats_to_try[-1]:  # Last format
-                            return False, f"Download failed: {str(e)}"
-                        continue
+                opts = {**ydl_opts, 'progress_hooks': [progress_hook]}
 
-                # If all formats failed
-                return False, "All format options failed - video may be unavailable or restricted"
+                try:
+                    with yt_dlp.YoutubeDL(opts) as ydl:
+                        # extract_info raises on failure like download()
+                        # does, but also hands back where the file went
+                        info = ydl.extract_info(url, download=True)
+                        downloads = info.get('requested_downloads') or ()
+                        file_path = downloads[0].get('filepath') if downloads else None
+                        return (True, f"Downloaded successfully using format: {info.get('format', '?')}",
+                                file_path or ydl.prepare_filename(info))
+
+                except yt_dlp.utils.DownloadCancelled:
+                    return False, "Download cancelled", None
+                except yt_dlp.DownloadError as e:
+                    if "Requested format is not available" in str(e):
+                        return False, "All format options failed - video may be unavailable or restricted", None
+                    return False, f"yt-dlp error: {str(e)}", None
+                except Exception as e:
+                    return False, f"Download failed: {str(e)}", None
 
             # Run in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                success, message = await loop.run_in_executor(executor, download_sync)
-                return success, message
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._download_executor, download_sync)
 
         except Exception as e:
-            return False, f"Fallback error: {str(e)}"
+            return False, f"Fallback error: {str(e)}", None
 
     def pause_download(self):
         """Pause current downloads"""
@@ -1601,19 +2395,31 @@ class YouTubeDownloaderGUI:
     def stop_download(self):
         """Stop current downloads"""
         self.is_downloading = False
-        self.status_var.set("Stopping downloads...")
+        self._cancel_event.set()  # Aborts in-flight transfers at their next chunk
+        # Stay in a stopping state until the batch has unwound; Start comes
+        # back with the download_complete message
+        self.pause_button.config(state=tk.DISABLED)
+        self.stop_button.config(state=tk.DISABLED)
+        self.show_status("Stopping downloads...")
 
     def clear_completed(self):
         """Clear completed items from queue"""
-        # Remove from queue
-        self.download_queue = [item for item in self.download_queue
-                               if item.status not in ["Completed", "Failed"]]
+        remaining = []
+        finished_ids = []
+        for item in self.download_queue:
+            if item.status in ("Completed", "Failed"):
+                self.uncount_status(item)
+                self._queue_urls.discard(item.url)
+                if item.tree_item_id:
+                    finished_ids.append(item.tree_item_id)
+                    del self._items_by_tree_id[item.tree_item_id]
+            else:
+                remaining.append(item)
 
-        # Remove from tree
-        for child in list(self.queue_tree.get_children()):
-            values = self.queue_tree.item(child)['values']
-            if len(values) > 0 and any(status in values[0] for status in ["✅ Completed", "❌ Failed"]):
-                self.queue_tree.delete(child)
+        # Remove from queue, then drop their rows by iid in one call
+        self.download_queue = remaining
+        if finished_ids:
+            self.queue_tree.delete(*finished_ids)
 
         self.update_queue_stats()
 
@@ -1624,10 +2430,15 @@ class YouTubeDownloaderGUI:
                                        "Downloads are in progress. Clear anyway?"):
                 return
 
+        self._queue_generation += 1
         self.download_queue.clear()
-        for child in self.queue_tree.get_children():
-            self.queue_tree.delete(child)
-        self.status_var.set("Queue cleared")
+        self._queue_urls.clear()
+        # Rows hidden by the filter aren't children of the tree, so delete by
+        # the iid index rather than get_children()
+        self.queue_tree.delete(*self._items_by_tree_id)
+        self._items_by_tree_id.clear()
+        self._status_counts.clear()
+        self.show_status("Queue cleared")
         self.update_queue_stats()
 
     def remove_selected(self):
@@ -1636,18 +2447,20 @@ class YouTubeDownloaderGUI:
         if not selected:
             return
 
+        removed = set()
         for item_id in selected:
-            # Find corresponding queue item and remove it
-            for i, item in enumerate(self.download_queue):
-                if hasattr(item, 'tree_item_id') and item.tree_item_id == item_id:
-                    del self.download_queue[i]
-                    break
+            item = self._items_by_tree_id.pop(item_id, None)
+            if item is not None:
+                self.uncount_status(item)
+                self._queue_urls.discard(item.url)
+                removed.add(id(item))
 
-            # Remove from tree
-            self.queue_tree.delete(item_id)
+        # Drop them from the queue in one pass, and their rows in one call
+        self.download_queue[:] = [item for item in self.download_queue if id(item) not in removed]
+        self.queue_tree.delete(*selected)
 
         self.update_queue_stats()
-        self.status_var.set("Removed selected items")
+        self.show_status("Removed selected items")
 
     def retry_selected(self):
         """Retry selected failed downloads"""
@@ -1656,17 +2469,14 @@ class YouTubeDownloaderGUI:
             return
 
         for item_id in selected:
-            # Find corresponding queue item
-            for item in self.download_queue:
-                if hasattr(item, 'tree_item_id') and item.tree_item_id == item_id:
-                    if item.status in ["Failed", "Error"]:
-                        item.status = "Pending"
-                        item.progress = 0
-                        item.speed = ""
-                        item.eta = ""
-                        item.error = ""
-                        self.update_queue_item(item)
-                    break
+            item = self._items_by_tree_id.get(item_id)
+            if item is not None and item.status in ["Failed", "Error"]:
+                item.status = "Pending"
+                item.progress = 0
+                item.speed = ""
+                item.eta = ""
+                item.error = ""
+                self.update_queue_item(item)
 
         self.update_queue_stats()
 
@@ -1677,25 +2487,16 @@ class YouTubeDownloaderGUI:
             return
 
         for item_id in selected:
-            # Find corresponding queue item
-            for item in self.download_queue:
-                if hasattr(item, 'tree_item_id') and item.tree_item_id == item_id:
-                    if item.file_path and Path(item.file_path).exists():
-                        import subprocess
-                        import platform
-
-                        try:
-                            if platform.system() == "Windows":
-                                subprocess.run(["explorer", "/select,", item.file_path])
-                            elif platform.system() == "Darwin":  # macOS
-                                subprocess.run(["open", "-R", item.file_path])
-                            else:  # Linux
-                                subprocess.run(["xdg-open", str(Path(item.file_path).parent)])
-                        except Exception as e:
-                            messagebox.showerror("Error", f"Could not open file location: {e}")
-                    else:
-                        messagebox.showinfo("File Not Found", "File not found or download not completed")
-                    break
+            item = self._items_by_tree_id.get(item_id)
+            if item is None:
+                continue
+            if item.file_path and Path(item.file_path).exists():
+                try:
+                    _open_path(item.file_path, select=True)
+                except Exception as e:
+                    messagebox.showerror("Error", f"Could not open file location: {e}")
+            else:
+                messagebox.showinfo("File Not Found", "File not found or download not completed")
 
     def copy_url(self):
         """Copy URL of selected item"""
@@ -1704,62 +2505,38 @@ class YouTubeDownloaderGUI:
             return
 
         for item_id in selected:
-            # Find corresponding queue item
-            for item in self.download_queue:
-                if hasattr(item, 'tree_item_id') and item.tree_item_id == item_id:
-                    self.root.clipboard_clear()
-                    self.root.clipboard_append(item.url)
-                    self.status_var.set("URL copied to clipboard")
-                    break
+            item = self._items_by_tree_id.get(item_id)
+            if item is not None:
+                self.root.clipboard_clear()
+                self.root.clipboard_append(item.url)
+                self.show_status("URL copied to clipboard")
 
     def browse_directory(self):
         """Browse for download directory"""
         directory = filedialog.askdirectory(initialdir=self.download_dir.get())
         if directory:
             self.download_dir.set(directory)
-            self.save_settings()
+            self.schedule_settings_save()
 
     def reset_settings(self):
         """Reset settings to defaults"""
-        self.download_dir.set(str(Path.home() / "Downloads" / "YouTube"))
+        self.download_dir.set(_DEFAULT_DOWNLOAD_DIR)
         self.max_concurrent.set(3)
         self.video_quality.set("best")
         self.save_descriptions.set(False)
         self.auto_load_info.set(True)
         self.retry_attempts.set(3)
         self.timeout_seconds.set(30)
-        self.status_var.set("Settings reset to defaults")
+        self.show_status("Settings reset to defaults")
 
     def open_download_folder(self):
         """Open the download folder in file explorer"""
-        import subprocess
-        import platform
-
         folder_path = self.download_dir.get()
         try:
-            if platform.system() == "Windows":
-                subprocess.run(["explorer", folder_path])
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.run(["open", folder_path])
-            else:  # Linux
-                subprocess.run(["xdg-open", folder_path])
+            _open_path(folder_path)
         except Exception as e:
             messagebox.showerror("Error", f"Could not open folder: {e}")
 
-    def format_duration(self, seconds):
-        """Format duration in seconds to readable format"""
-        if not seconds:
-            return ""
-
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        seconds = seconds % 60
-
-        if hours > 0:
-            return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-        else:
-            return f"{minutes:02d}:{seconds:02d}"
-
     def format_views(self, views):
         """Format view count"""
         if views >= 1000000:
@@ -1769,59 +2546,150 @@ class YouTubeDownloaderGUI:
         else:
             return str(views)
 
+    def show_status(self, text):
+        """Set the status bar text"""
+        self.status_label.configure(text=text)
+
+    def post_progress(self, msg_type, msg_data):
+        """Record a progress update for the next process_progress drain.
+
+        Bars are keyed by name and video refreshes by item, so a newer
+        update replaces any the UI hasn't picked up yet.
+        """
+        key = (msg_type, id(msg_data)) if msg_type == "video_status" else msg_type
+        with self._progress_lock:
+            self._progress_pending[key] = msg_data
+
+    def post_message(self, msg_type, msg_data=None):
+        """Queue a message for the UI thread (safe from any thread).
+
+        Only the queue is touched here. Waking Tk from a worker thread
+        blocks until the main loop services the call, which deadlocks if
+        the UI thread is itself waiting on that worker; poll_messages
+        picks the message up instead.
+        """
+        self.message_queue.put((msg_type, msg_data))
+
+    def poll_soon(self):
+        """Bring the next poll forward after the UI starts background work"""
+        self._idle_polls = 0
+        if self._poll_after is not None:
+            self.root.after_cancel(self._poll_after)
+        self._poll_after = self.root.after(100, self.poll_messages)
+
+    def poll_messages(self):
+        """Timer that drains worker messages and applies progress.
+
+        Progress and the message queue share this one after() loop. Each
+        progress drain applies at most one write per bar and per row, so
+        10 Hz looks just as smooth as 20 Hz. While downloads or loads are
+        running, and for a second after the last message, it ticks every
+        100 ms; otherwise it backs off to once a second.
+        """
+        handled = self.process_messages()
+        active = self.process_progress()
+        with self._progress_lock:
+            active = active or handled or self._loads_running > 0
+        self._idle_polls = 0 if active else self._idle_polls + 1
+        delay = 1000 if self._idle_polls > 10 else 100
+        self._poll_after = self.root.after(delay, self.poll_messages)
+
     def process_messages(self):
-        """Process messages from worker threads"""
+        """Process messages from worker threads.
+
+        Returns True if there were any.
+        """
+        handled = False
+        # Drain everything that queued up since the last tick, but only
+        # apply the newest status line and refresh the stats once --
+        # concurrent downloads post far more of these than can be seen.
+        latest_status = None
+        refresh_stats = False
+        refresh_analytics = False
         try:
             while True:
                 msg_type, msg_data = self.message_queue.get_nowait()
+                handled = True
 
                 if msg_type == "status":
-                    self.status_var.set(msg_data)
+                    latest_status = msg_data
+                # Worker info/errors are per-URL and can arrive in bursts
+                # (a bad playlist paste); a modal dialog each would block
+                # the drain until clicked through, so they go to the status
+                # bar and the activity log instead.
                 elif msg_type == "info":
-                    messagebox.showinfo("Information", msg_data)
+                    latest_status = f"ℹ️ {msg_data}"
+                    self.log_activity(f"ℹ️ {msg_data}")
                 elif msg_type == "error":
-                    messagebox.showerror("Error", msg_data)
+                    latest_status = f"❌ {msg_data}"
+                    self.log_activity(f"❌ {msg_data}")
                 elif msg_type == "update_stats":
-                    self.update_queue_stats()
+                    refresh_stats = True
+                elif msg_type == "update_analytics":
+                    refresh_analytics = True
+                elif msg_type == "add_rows":
+                    self.insert_queue_rows(msg_data)
                 elif msg_type == "log_activity":
                     self.log_activity(msg_data)
                 elif msg_type == "download_complete":
                     self.download_button.config(state=tk.NORMAL)
                     self.pause_button.config(state=tk.DISABLED)
                     self.stop_button.config(state=tk.DISABLED)
-                    self.overall_progress_var.set(0)
-                    self.current_progress_var.set(0)
+                    self.show_progress('overall', 0)
+                    self.show_progress('current', 0)
 
         except queue.Empty:
             pass
 
-        # Schedule next check
-        self.root.after(100, self.process_messages)
+        if latest_status is not None:
+            self.show_status(latest_status)
+        if refresh_stats:
+            self.update_queue_stats()
+        if refresh_analytics:
+            self.update_analytics()
+        return handled
 
     def process_progress(self):
-        """Process progress updates with visual enhancements"""
-        try:
-            updates_processed = 0
-            while updates_processed < 10:  # Limit updates per cycle to prevent UI lag
-                msg_type, msg_data = self.progress_queue.get_nowait()
-
-                if msg_type == "overall_progress":
-                    self.overall_progress_var.set(msg_data)
-                    self.overall_progress_label.config(text=f"{int(msg_data)}%")
-                elif msg_type == "current_progress":
-                    self.current_progress_var.set(msg_data)
-                    self.current_progress_label.config(text=f"{int(msg_data)}%")
-                elif msg_type == "video_status":
-                    self.update_queue_item(msg_data)
-                    self.update_queue_stats()
-
-                updates_processed += 1
+        """Apply pending progress updates.
 
-        except queue.Empty:
-            pass
-
-        # Schedule next check - more frequent for better responsiveness
-        self.root.after(50, self.process_progress)
+        Returns True while progress is still flowing.
+        """
+        # Swap the pending dict for an empty one under the lock; the
+        # download threads keep filling the new one while this drains the
+        # old.
+        with self._progress_lock:
+            pending = self._progress_pending
+            self._progress_pending = {}
+            active = [item.progress for item in self._active_downloads]
+        drained = bool(pending)
+
+        overall = pending.pop("overall_progress", None)
+        changed_items = pending
+
+        if overall is not None:
+            self.show_progress('overall', overall)
+        # Mean of the running downloads; back to 0 only once none are left
+        self.show_progress('current', sum(active) / len(active) if active else 0)
+        if changed_items:
+            for video_info in changed_items.values():
+                self.update_queue_item(video_info)
+            self.update_queue_stats()
+
+        return drained or self.is_downloading
+
+    def show_progress(self, which: str, value: float):
+        """Set the 'overall' or 'current' bar and its label.
+
+        yt-dlp reports fractions of a percent, far finer than a bar a few
+        hundred pixels wide can show. Both widgets are left alone until the
+        whole-percent value changes.
+        """
+        percent = int(value)
+        if percent == self._shown_progress[which]:
+            return
+        self._shown_progress[which] = percent
+        getattr(self, f'{which}_progress_bar').configure(value=percent)
+        getattr(self, f'{which}_progress_label').config(text=f"{percent}%")
 
     def _yt_dlp_shared_opts(self) -> Dict:
         """Options that every yt-dlp call in the GUI must include.
@@ -1842,6 +2710,23 @@ class YouTubeDownloaderGUI:
             opts['cookiesfrombrowser'] = (browser,)
         return opts
 
+    def schedule_settings_save(self, event=None):
+        """Save settings shortly after the last change.
+
+        Spinbox arrows and combo changes arrive in bursts; restarting a
+        500 ms timer on each one turns the burst into a single write.
+        """
+        if self._settings_save_after is not None:
+            self.root.after_cancel(self._settings_save_after)
+        self._settings_save_after = self.root.after(500, self.flush_settings)
+
+    def flush_settings(self):
+        """Run a pending debounced settings save now"""
+        if self._settings_save_after is not None:
+            self.root.after_cancel(self._settings_save_after)
+            self._settings_save_after = None
+            self.save_settings()
+
     def save_settings(self):
         """Enhanced settings saving with user feedback"""
         settings = {
@@ -1851,29 +2736,48 @@ class YouTubeDownloaderGUI:
             'save_descriptions': self.save_descriptions.get(),
             'auto_load_info': self.auto_load_info.get(),
             'cookies_browser': self.cookies_browser.get(),
-            'retry_attempts': getattr(self, 'retry_attempts', tk.IntVar(value=3)).get(),
-            'timeout_seconds': getattr(self, 'timeout_seconds', tk.IntVar(value=30)).get()
+            'retry_attempts': self.retry_attempts.get(),
+            'timeout_seconds': self.timeout_seconds.get()
         }
 
-        settings_file = Path.home() / '.youtube_downloader_enhanced_settings.json'
-        try:
-            with open(settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
-            self.status_var.set("💾 Settings saved successfully")
+        # Only touch the disk when something actually changed, and then
+        # from the settings thread so a slow drive can't stall the window.
+        # write_settings records what it saved only once it's on disk, so
+        # a failed write is retried by the next save.
+        if settings != self._last_saved_settings:
+            self._settings_executor.submit(self.write_settings, settings)
+        self.show_status("💾 Settings saved successfully")
 
-            # Show temporary success message
-            self.root.after(3000, lambda: self.status_var.set("Ready to download"))
+        # Show temporary success message
+        self.root.after(3000, lambda: self.show_status("Ready to download"))
 
+    def write_settings(self, settings):
+        """Write settings to disk (runs on the settings thread).
+
+        The new file is written alongside and swapped in with os.replace,
+        so a crash mid-write can't leave a truncated settings file behind.
+        """
+        settings_file = self.settings_file
+        try:
+            tmp_file = settings_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'w', buffering=65536) as f:
+                json.dump(settings, f, indent=2)
+            os.replace(tmp_file, settings_file)
+            self._last_saved_settings = settings
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to save settings: {e}")
+            # Queue-only: shutdown() waits on this thread, so it must never
+            # call into Tk. Printed too, as nothing drains the queue on close.
+            print(f"Failed to save settings: {e}")
+            self.post_message("error", f"Failed to save settings: {e}")
 
     def load_settings(self):
         """Enhanced settings loading with defaults"""
-        settings_file = Path.home() / '.youtube_downloader_enhanced_settings.json'
+        settings_file = self.settings_file
         if settings_file.exists():
             try:
                 with open(settings_file, 'r') as f:
                     settings = json.load(f)
+                self._last_saved_settings = settings
 
                 self.download_dir.set(settings.get('download_dir', self.download_dir.get()))
                 self.max_concurrent.set(settings.get('max_concurrent', 3))
@@ -1882,58 +2786,26 @@ class YouTubeDownloaderGUI:
                 self.auto_load_info.set(settings.get('auto_load_info', True))
                 self.cookies_browser.set(settings.get('cookies_browser', 'none'))
 
-                # Initialize new settings with defaults if they don't exist
-                if not hasattr(self, 'retry_attempts'):
-                    self.retry_attempts = tk.IntVar(value=settings.get('retry_attempts', 3))
-                else:
-                    self.retry_attempts.set(settings.get('retry_attempts', 3))
-
-                if not hasattr(self, 'timeout_seconds'):
-                    self.timeout_seconds = tk.IntVar(value=settings.get('timeout_seconds', 30))
-                else:
-                    self.timeout_seconds.set(settings.get('timeout_seconds', 30))
+                self.retry_attempts.set(settings.get('retry_attempts', 3))
+                self.timeout_seconds.set(settings.get('timeout_seconds', 30))
 
             except Exception as e:
                 print(f"Error loading settings: {e}")
-                # Initialize defaults if loading fails
-                if not hasattr(self, 'retry_attempts'):
-                    self.retry_attempts = tk.IntVar(value=3)
-                if not hasattr(self, 'timeout_seconds'):
-                    self.timeout_seconds = tk.IntVar(value=30)
-        else:
-            # Initialize defaults for new installations
-            if not hasattr(self, 'retry_attempts'):
-                self.retry_attempts = tk.IntVar(value=3)
-            if not hasattr(self, 'timeout_seconds'):
-                self.timeout_seconds = tk.IntVar(value=30)
 
     def update_queue_item(self, video_info: VideoInfo):
         """Update item in queue tree using stored tree item reference"""
         # Track analytics changes (removed duplicate analytics tracking since it's now in record_download)
         try:
-            # Try to use stored tree item ID first
-            if hasattr(video_info, 'tree_item_id') and video_info.tree_item_id:
-                try:
-                    # Check if the item still exists
-                    if self.queue_tree.exists(video_info.tree_item_id):
-                        self.update_tree_item(video_info.tree_item_id, video_info)
-                        return
-                except Exception:
-                    pass
-
-            # Fallback to URL matching
-            for child in self.queue_tree.get_children():
-                try:
-                    # Find item by matching with download queue
-                    for queue_item in self.download_queue:
-                        if (hasattr(queue_item, 'tree_item_id') and
-                                queue_item.tree_item_id == child and
-                                queue_item.url == video_info.url):
-                            video_info.tree_item_id = child
-                            self.update_tree_item(child, video_info)
-                            return
-                except Exception:
-                    continue
+            # Every row is inserted with its VideoInfo holding the tree iid,
+            # so go straight to it rather than scanning the tree per update.
+            item_id = video_info.tree_item_id
+            if item_id and self.queue_tree.exists(item_id):
+                old_status = video_info.counted_status
+                self.count_status(video_info)
+                if old_status != video_info.status:
+                    self.refilter_row(video_info, old_status)
+                self.update_tree_item(item_id, video_info)
+                return
 
         except Exception as e:
             print(f"Error updating queue item: {e}")
@@ -1950,37 +2822,18 @@ class YouTubeDownloaderGUI:
             # Format progress with visual indicator
             progress_text = f"{video_info.progress}%"
             if video_info.status == "Downloading" and video_info.progress > 0:
-                # Add visual progress bar - 20 characters max for better fit
-                filled = video_info.progress // 5  # Each █ represents 5%
-                empty = 20 - filled
-                progress_text = f"{video_info.progress}% [{'█' * filled}{'░' * empty}]"
+                # Add visual progress bar - 20 characters, each █ is 5%
+                progress_text = f"{video_info.progress}% [{_BARS[video_info.progress // 5]}]"
 
             # Color-code status with emojis
-            status_text = video_info.status
-            if video_info.status == "Completed":
-                status_text = "✅ Completed"
-            elif video_info.status == "Failed":
-                status_text = "❌ Failed"
-            elif video_info.status == "Downloading":
-                status_text = "⬇️ Downloading"
-            elif video_info.status == "Pending":
-                status_text = "⏳ Pending"
-            elif video_info.status == "Loading Info":
-                status_text = "🔄 Loading Info"
-            elif video_info.status == "Info Failed":
-                status_text = "❌ Info Failed"
-            elif video_info.status == "Unavailable":
-                status_text = "🚫 Unavailable"
-            elif video_info.status == "Error":
-                status_text = "⚠️ Error"
+            status_text = _STATUS_DISPLAY.get(video_info.status, video_info.status)
 
             # Clean up title display
             title_text = video_info.title
             if title_text.startswith("📡 "):
                 title_text = title_text[2:]  # Remove loading emoji once loaded
 
-            # Update the tree item
-            self.queue_tree.item(item_id, values=(
+            values = (
                 status_text,
                 title_text,
                 video_info.duration,
@@ -1989,15 +2842,31 @@ class YouTubeDownloaderGUI:
                 video_info.speed,
                 video_info.eta,
                 video_info.size
-            ))
+            )
 
-            # Scroll to the current item if it's downloading
-            if video_info.status == "Downloading":
+            # Update the tree item. A progress tick usually changes only the
+            # progress, speed and ETA cells, so write just the cells that
+            # differ from what the row already shows.
+            shown = video_info.shown_values
+            if values == shown:
+                return
+            if len(shown) == len(values):
+                for column, old, new in zip(_QUEUE_COLUMNS, shown, values):
+                    if old != new:
+                        self.queue_tree.set(item_id, column, new)
+            else:
+                self.queue_tree.item(item_id, values=values)
+            video_info.shown_values = values
+
+            # Scroll to the current item if it's downloading. see() recomputes
+            # the scroll position, so only ask when the row is off screen
+            # (bbox is empty for rows outside the visible area). A row the
+            # filter has detached has nowhere to scroll to.
+            if (video_info.status == "Downloading"
+                    and self._queue_filter in (None, "Downloading")
+                    and not self.queue_tree.bbox(item_id)):
                 self.queue_tree.see(item_id)
 
-            # Force UI update
-            self.root.update_idletasks()
-
         except Exception as e:
             print(f"Error updating tree item: {e}")
 
@@ -2211,7 +3080,6 @@ def main():
 
     # Set modern window properties
     root.title("🎬 YouTube Downloader Pro - Enhanced Edition")
-    root.geometry("1400x900")
     root.minsize(1000, 700)
 
     # Set DPI awareness for Windows
@@ -2235,12 +3103,11 @@ def main():
     # Create the application
     app = YouTubeDownloaderGUI(root)
 
-    # Center window on screen
-    root.update_idletasks()
-    width = root.winfo_width()
-    height = root.winfo_height()
-    x = (root.winfo_screenwidth() // 2) - (width // 2)
-    y = (root.winfo_screenheight() // 2) - (height // 2)
+    # Center window on screen. YouTubeDownloaderGUI sizes the window to
+    # _WINDOW_SIZE, so there's no need to force a layout pass to read it back.
+    width, height = _WINDOW_SIZE
+    x = (root.winfo_screenwidth() - width) // 2
+    y = (root.winfo_screenheight() - height) // 2
     root.geometry(f'{width}x{height}+{x}+{y}')
 
     # Add a modern app icon to taskbar (Windows)
@@ -2251,16 +3118,20 @@ def main():
         pass
 
     # Handle window closing gracefully
+    def close():
+        app.shutdown()
+        root.destroy()
+
     def on_closing():
         if app.is_downloading:
             if messagebox.askyesno("Confirm Exit",
                                    "Downloads are in progress. Are you sure you want to exit?"):
                 app.stop_download()
-                root.after(1000, root.destroy)  # Give time for cleanup
+                root.after(1000, close)  # Give time for cleanup
             else:
                 return
         else:
-            root.destroy()
+            close()
 
     root.protocol("WM_DELETE_WINDOW", on_closing)
 
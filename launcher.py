@@ -8,8 +8,6 @@ It also handles the pkg_resources deprecation warning.
 
 import os
 import sys
-import subprocess
-import importlib.util
 import warnings
 from pathlib import Path
 
@@ -37,6 +35,10 @@ except ImportError:
 warnings.filterwarnings("ignore", category=UserWarning, message=".*pkg_resources.*")
 warnings.filterwarnings("ignore", category=DeprecationWarning, message=".*pkg_resources.*")
 
+# Repo root (the folder holding this script), resolved once for every
+# lookup below.
+_HERE = Path(__file__).resolve().parent
+
 
 def check_python_version():
     """Check if Python version is compatible"""
@@ -47,24 +49,71 @@ def check_python_version():
     return True
 
 
-def check_dependency(package_name, import_name=None):
-    """Check if a package is installed"""
-    if import_name is None:
-        import_name = package_name
+def _normalize_name(name):
+    """Normalize a distribution name the way pip compares them"""
+    return name.lower().replace("_", "-").replace(".", "-")
+
+
+def scan_installed():
+    """Return the installed distribution names and top-level module names.
+
+    One pass over sys.path that reads directory listings only. A
+    dist-info/egg-info folder's name already carries its distribution
+    name, so no METADATA file is opened. The other entries give the
+    importable top-level names, so a package with no dist-info (vendored,
+    or on PYTHONPATH) still counts as installed.
+    """
+    dists = set()
+    modules = set()
+    for path_entry in sys.path:
+        try:
+            entries = os.scandir(path_entry or ".")
+        except OSError:
+            continue  # Missing folder or a zip archive
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if name.endswith((".dist-info", ".egg-info")):
+                    dists.add(_normalize_name(name.split("-", 1)[0]))
+                elif name.endswith((".py", ".pyd", ".so")):
+                    modules.add(name.split(".", 1)[0])
+                elif "." not in name:
+                    modules.add(name)
+    return dists, modules
+
+
+def check_dependency(package_name, import_name, installed):
+    """Check if a package is installed, given scan_installed()'s result.
+
+    Anything the listing can't see (zip imports, custom finders) falls
+    back to an import-spec probe for that one package.
+    """
+    dists, modules = installed
+    if _normalize_name(package_name) in dists or import_name in modules:
+        return True
+
+    import importlib.util
 
     try:
-        spec = importlib.util.find_spec(import_name)
-        return spec is not None
-    except ImportError:
+        return importlib.util.find_spec(import_name) is not None
+    except (ImportError, ValueError):
         return False
 
 
-def install_package(package_name):
-    """Install a package using pip"""
+def install_packages(package_names):
+    """Install packages using a single pip invocation.
+
+    One pip process resolves everything at once instead of paying pip's
+    startup cost per package. The version check is skipped because it
+    goes out to the network on every run.
+    """
+    import subprocess
+
     try:
-        print(f"📦 Installing {package_name}...")
+        print(f"📦 Installing {', '.join(package_names)}...")
         subprocess.check_call([
-            sys.executable, "-m", "pip", "install", package_name, "--user"
+            sys.executable, "-m", "pip", "install", "--user",
+            "--disable-pip-version-check", "--no-input", *package_names
         ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         return True
     except subprocess.CalledProcessError:
@@ -86,23 +135,23 @@ def check_and_install_dependencies():
 
     print("🔍 Checking dependencies...")
 
+    installed = scan_installed()
+    lines = []
     for package_name, import_name in dependencies:
-        if not check_dependency(package_name, import_name):
+        if not check_dependency(package_name, import_name, installed):
             missing_deps.append(package_name)
-            print(f"❌ Missing: {package_name}")
+            lines.append(f"❌ Missing: {package_name}")
         else:
-            print(f"✅ Found: {package_name}")
+            lines.append(f"✅ Found: {package_name}")
+    print("\n".join(lines))
 
     if missing_deps:
         print(f"\n📦 Installing {len(missing_deps)} missing package(s)...")
 
-        for package in missing_deps:
-            if install_package(package):
-                print(f"✅ Installed: {package}")
-            else:
-                print(f"❌ Failed to install: {package}")
-                print(f"Please install manually: pip install {package}")
-                return False
+        if not install_packages(missing_deps):
+            print(f"❌ Failed to install: {', '.join(missing_deps)}")
+            print(f"Please install manually: pip install {' '.join(missing_deps)}")
+            return False
 
         print("✅ All dependencies installed!")
     else:
@@ -113,7 +162,6 @@ def check_and_install_dependencies():
 
 def check_required_files():
     """Check if required files exist"""
-    current_dir = Path(__file__).parent
     required_files = [
         "app/main.py",
         "app/bridge.py",
@@ -122,7 +170,7 @@ def check_required_files():
     missing_files = []
 
     for file_name in required_files:
-        file_path = current_dir / file_name
+        file_path = _HERE / file_name
         if not file_path.exists():
             missing_files.append(file_name)
 
@@ -146,8 +194,8 @@ def launch_application():
     try:
         print("\n🚀 Launching YouTube Downloader Pro...")
 
-        current_dir = Path(__file__).parent
-        sys.path.insert(0, str(current_dir))
+        if str(_HERE) not in sys.path:
+            sys.path.insert(0, str(_HERE))
 
         try:
             import webview  # noqa: F401 — probe the pywebview install
@@ -9,10 +9,15 @@
 # Options:
 #     -Version 1.0.0     stamped into the zip filename (default: dev)
 #     -Clean             wipe .venv-build and dist first
+#     -ZipLevel Fastest  zip compression (default: smallest the runtime
+#                        supports -- SmallestSize on PowerShell 7,
+#                        Optimal on Windows PowerShell 5.1)
 
 param(
     [string]$Version = "dev",
-    [switch]$Clean
+    [switch]$Clean,
+    [ValidateSet("", "SmallestSize", "Optimal", "Fastest", "NoCompression")]
+    [string]$ZipLevel = ""
 )
 
 $ErrorActionPreference = "Stop"
@@ -82,34 +87,85 @@ $ZipPath = Join-Path $DistDir $ZipName
 Write-Host "[zip] packaging $ZipName" -ForegroundColor Cyan
 if (Test-Path $ZipPath) { Remove-Item $ZipPath }
 
-# Include the install/uninstall scripts so users get a one-click setup
-# straight out of the extracted zip.
-$StagingDir = Join-Path $DistDir "_stage"
-if (Test-Path $StagingDir) { Remove-Item -Recurse -Force $StagingDir }
-New-Item -ItemType Directory -Path $StagingDir | Out-Null
-Copy-Item -Recurse (Join-Path $DistDir "YouTManager") (Join-Path $StagingDir "YouTManager")
-Copy-Item (Join-Path $RepoRoot "scripts\install.ps1")   (Join-Path $StagingDir "install.ps1")
-Copy-Item (Join-Path $RepoRoot "scripts\uninstall.ps1") (Join-Path $StagingDir "uninstall.ps1")
-Copy-Item (Join-Path $RepoRoot "install.bat")           (Join-Path $StagingDir "install.bat")
-Copy-Item (Join-Path $RepoRoot "README.md")             (Join-Path $StagingDir "README.md")
-Copy-Item (Join-Path $RepoRoot "LICENSE")               (Join-Path $StagingDir "LICENSE")
-
-# Compress-Archive can trip on locks held by Windows Defender scanning
-# freshly-written PyInstaller binaries. Give it a beat and retry a
-# few times before giving up.
+# Stream every file straight from its source into the archive instead of
+# copying the ~22 MB app folder into a staging dir first -- halves the
+# bytes moved and skips the Remove-Item walk at the end. The install /
+# uninstall scripts ride along so users get a one-click setup straight
+# out of the extracted zip.
+Add-Type -AssemblyName System.IO.Compression, System.IO.Compression.FileSystem
+
+# The zip is built once and downloaded by every user, so spend the extra
+# build-time CPU on the best ratio available. SmallestSize only exists on
+# .NET 6+ (PowerShell 7); Windows PowerShell tops out at Optimal.
+$LevelType = [System.IO.Compression.CompressionLevel]
+if (-not $ZipLevel) {
+    $ZipLevel = if ([enum]::IsDefined($LevelType, "SmallestSize")) { "SmallestSize" } else { "Optimal" }
+}
+if (-not [enum]::IsDefined($LevelType, $ZipLevel)) {
+    throw "-ZipLevel $ZipLevel isn't supported by this PowerShell (try Optimal)"
+}
+$CompressionLevel = [enum]::Parse($LevelType, $ZipLevel)
+Write-Host "[zip] compression level: $ZipLevel" -ForegroundColor Cyan
+
+$AppDir = Join-Path $DistDir "YouTManager"
+$ZipMembers = @(
+    @{ Src = (Join-Path $RepoRoot "scripts\install.ps1");   Name = "install.ps1" },
+    @{ Src = (Join-Path $RepoRoot "scripts\uninstall.ps1"); Name = "uninstall.ps1" },
+    @{ Src = (Join-Path $RepoRoot "install.bat");           Name = "install.bat" },
+    @{ Src = (Join-Path $RepoRoot "README.md");             Name = "README.md" },
+    @{ Src = (Join-Path $RepoRoot "LICENSE");               Name = "LICENSE" }
+)
+
+# Fail fast on a missing repo file instead of letting it surface as five
+# "locked by antivirus" retries below. One listing per source folder
+# answers every lookup, rather than a separate stat per member.
+$present = New-Object System.Collections.Generic.HashSet[string] ([StringComparer]::OrdinalIgnoreCase)
+foreach ($dir in $ZipMembers.Src | ForEach-Object { Split-Path -Parent $_ } | Sort-Object -Unique) {
+    foreach ($path in [System.IO.Directory]::EnumerateFiles($dir)) { [void]$present.Add($path) }
+}
+$missing = @($ZipMembers.Src | Where-Object { -not $present.Contains($_) })
+if ($missing) { throw "missing files for the release zip: $($missing -join ', ')" }
+
+# EnumerateFiles streams plain paths straight from the directory walk;
+# Get-ChildItem -Recurse would build a FileInfo (and re-stat) per entry
+# for the hundreds of files PyInstaller leaves in the folder.
+$AllFiles = [System.IO.SearchOption]::AllDirectories
+foreach ($path in [System.IO.Directory]::EnumerateFiles($AppDir, "*", $AllFiles)) {
+    $rel = $path.Substring($AppDir.Length + 1) -replace '\\', '/'
+    $ZipMembers += @{ Src = $path; Name = "YouTManager/$rel" }
+}
+
+# Reproducible archive: fixed entry order and a fixed timestamp (the
+# earliest a zip header can store), so rebuilding the same tree yields a
+# byte-identical zip and diffing two releases only shows real changes.
+$ZipMembers = @($ZipMembers | Sort-Object { $_.Name } -Culture "")
+$ZipEpoch = [DateTimeOffset]::new(1980, 1, 1, 0, 0, 0, [TimeSpan]::Zero)
+
+# Reading freshly-written PyInstaller binaries can trip on locks held by
+# Windows Defender scanning them. Give it a beat and retry a few times
+# before giving up.
 $compressed = $false
 for ($i = 0; $i -lt 5; $i++) {
+    $zip = $null
     try {
         Start-Sleep -Seconds 2
-        Compress-Archive -Path (Join-Path $StagingDir "*") -DestinationPath $ZipPath -CompressionLevel Optimal -Force
+        $zip = [System.IO.Compression.ZipFile]::Open($ZipPath, [System.IO.Compression.ZipArchiveMode]::Create)
+        foreach ($m in $ZipMembers) {
+            $entry = [System.IO.Compression.ZipFileExtensions]::CreateEntryFromFile(
+                $zip, $m.Src, $m.Name, $CompressionLevel)
+            $entry.LastWriteTime = $ZipEpoch
+        }
+        $zip.Dispose()
+        $zip = $null
         $compressed = $true
         break
     } catch {
+        if ($zip) { $zip.Dispose() }
+        if (Test-Path $ZipPath) { Remove-Item $ZipPath }
         Write-Host "[zip] attempt $($i + 1) failed ($($_.Exception.Message)); retrying..." -ForegroundColor Yellow
     }
 }
-if (-not $compressed) { throw "Compress-Archive kept failing -- files may be locked by antivirus" }
-Remove-Item -Recurse -Force $StagingDir
+if (-not $compressed) { throw "zip kept failing -- files may be locked by antivirus" }
 
 $ZipSize = [math]::Round((Get-Item $ZipPath).Length / 1MB, 1)
 Write-Host "[done] $ZipPath ($ZipSize MB)" -ForegroundColor Green
@@ -11,6 +11,7 @@ Run from the repo root with the venv's Python:
 
 from __future__ import annotations
 
+import io
 from pathlib import Path
 
 try:
@@ -112,6 +113,14 @@ def render_icon(size: int) -> Image.Image:
     return variant(size)
 
 
+def _save(img: Image.Image, path: Path, fmt: str, **params) -> None:
+    """Encode into memory, then hit the disk with one write. Pillow's
+    encoders otherwise stream many small writes into the file handle."""
+    buf = io.BytesIO()
+    img.save(buf, format=fmt, **params)
+    path.write_bytes(buf.getvalue())
+
+
 def main():
     # Output goes into <repo>/assets/. This script lives in <repo>/scripts/.
     out = Path(__file__).resolve().parent.parent / "assets"
@@ -123,25 +132,29 @@ def main():
     images = [render_icon(s) for s in sizes]
 
     ico_path = out / "icon.ico"
-    # Pillow packs all provided images into a single multi-resolution .ico
-    # when we pass `sizes=` and the base image is the largest.
-    images[-1].save(
+    # Pillow packs a multi-resolution .ico from the largest image. Without
+    # `append_images` it re-downsamples that 256px frame for every size,
+    # throwing away the 2-plate small-size renders above and redoing a
+    # full Lanczos pass per level. Hand it the frames we already have.
+    _save(
+        images[-1],
         ico_path,
-        format="ICO",
+        "ICO",
         sizes=[(s, s) for s in sizes],
+        append_images=images[:-1],
     )
     print(f"[OK] {ico_path.name} ({ico_path.stat().st_size // 1024} KB, {len(sizes)} sizes)")
 
     # Convenience PNG for docs / marketing.
     png_path = out / "icon.png"
-    render_icon(512).save(png_path, "PNG")
+    _save(render_icon(512), png_path, "PNG")
     print(f"[OK] {png_path.name}")
 
     # macOS ICNS — optional; only writes if Pillow was built with the
     # pillow-heif dependency.
     try:
         icns_path = out / "icon.icns"
-        render_icon(512).save(icns_path, "ICNS")
+        _save(render_icon(512), icns_path, "ICNS")
         print(f"[OK] {icns_path.name}")
     except Exception:
         print("[skip] icon.icns (install pillow-heif for macOS builds)")
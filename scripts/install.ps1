@@ -79,7 +79,11 @@ $null = New-Item -ItemType Directory -Force -Path (Split-Path $InstallDir)
 # Robocopy handles antivirus-locked files better than Copy-Item — has
 # built-in retry (/R:5 W:1) and mirrors the source tree exactly. Exit
 # codes 0-7 are success (files copied / already same); 8+ is real error.
-$robocopyOut = & robocopy $SourceDir $InstallDir /MIR /R:5 /W:1 /NP /NDL /NJH /NJS 2>&1
+# /MT:8 overlaps the hundreds of small PyInstaller files instead of paying
+# per-file open/close latency serially.
+# /NFL drops the one-line-per-file listing: the output is only shown when
+# the copy fails, and robocopy's error lines are still emitted without it.
+$robocopyOut = & robocopy $SourceDir $InstallDir /MIR /MT:8 /R:5 /W:1 /NP /NFL /NDL /NJH /NJS 2>&1
 if ($LASTEXITCODE -ge 8) {
     Write-Host $robocopyOut
     throw "robocopy failed with exit code $LASTEXITCODE"